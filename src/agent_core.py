@@ -7,19 +7,15 @@ analyzing code, generating documentation, and performing critique-refinement cyc
 It is designed to be used by orchestration layers like LangGraph or other runners.
 """
 
+import io
 import os
-import sys
+import re
 import logging
+import threading
 import time
 import hashlib
-import json
-from pathlib import Path
 from typing import List, Dict, Optional, Union
-try:
-    from .utils.semantic_critique import ValidationIssue
-except ImportError:
-    from utils.semantic_critique import ValidationIssue
-from concurrent.futures import ThreadPoolExecutor, as_completed
+from concurrent.futures import ThreadPoolExecutor
 from dotenv import load_dotenv
 
 try:
@@ -28,8 +24,9 @@ try:
         save_documentation,
         generate_documentation
     )
-    from .utils.file_utils import find_code_files, read_file_safe, detect_project_type
-    from .utils.api_utils import call_ollama_api, get_ollama_headers, OLLAMA_API_URL, MODEL_NAME, API_TIMEOUT
+    from .utils.file_utils import find_code_files, read_file_safe, detect_project_type, MAX_CONTENT_PREVIEW
+    from .utils.text_utils import extract_doc_comments
+    from .utils.api_utils import call_ollama_api, call_ollama_api_many, warm_model
     from .utils.semantic_critique import (
         SemanticCritiqueAnalyzer,
         DocumentationValidator,
@@ -48,8 +45,9 @@ except ImportError:
         save_documentation,
         generate_documentation
     )
-    from utils.file_utils import find_code_files, read_file_safe, detect_project_type
-    from utils.api_utils import call_ollama_api, get_ollama_headers, OLLAMA_API_URL, MODEL_NAME, API_TIMEOUT
+    from utils.file_utils import find_code_files, read_file_safe, detect_project_type, MAX_CONTENT_PREVIEW
+    from utils.text_utils import extract_doc_comments
+    from utils.api_utils import call_ollama_api, call_ollama_api_many, warm_model
     from utils.semantic_critique import (
         SemanticCritiqueAnalyzer,
         DocumentationValidator,
@@ -67,6 +65,65 @@ load_dotenv()
 
 logger = logging.getLogger(__name__)
 
+# Explicit "no changes needed" phrases, compiled once into a single
+# alternation so positivity checks run one C-level scan over the critique
+# instead of lowercasing it and looping substring tests in Python
+_EXPLICIT_POSITIVE_RE = re.compile(
+    r"\b(?:" + "|".join(re.escape(phrase) for phrase in (
+        "excellent and requires no changes",
+        "perfect and requires no changes",
+        "documentation is excellent",
+        "documentation is perfect",
+        "no changes needed",
+        "no improvements necessary",
+        "satisfactory as is",
+    )) + r")\b",
+    re.IGNORECASE
+)
+
+# The critique prompt instructs the model to open with its verdict, so only
+# this leading slice of a critique is scanned for the explicit positive
+# phrases — both by is_critique_positive and by the streaming watch below
+_VERDICT_SCAN_WINDOW = 2048
+
+
+def _positive_verdict_watch(max_window: int = 256):
+    """
+    Build an on_token callback that aborts a critique stream early.
+
+    Keeps a small rolling window of recent tokens; once the explicit
+    "no changes" verdict shows up there is nothing left worth generating,
+    so the callback returns False and the stream is cut. The partial text
+    returned still contains the verdict, which is_critique_positive
+    detects in its opening-window scan. Past that opening window the
+    watch stands down: aborting on a late phrase would hand back a
+    truncated critique that is_critique_positive no longer recognises as
+    positive, sending garbage to the semantic scorer (and the cache).
+
+    Args:
+        max_window: Rolling window size in characters
+
+    Returns:
+        Callback suitable for call_ollama_api's on_token parameter
+    """
+    window = ""
+    seen = 0
+
+    def watch(token: str):
+        nonlocal window, seen
+        if seen >= _VERDICT_SCAN_WINDOW:
+            return None
+        window = (window + token)[-max_window:]
+        seen += len(token)
+        # The second check mirrors the endpos bound in is_critique_positive:
+        # a phrase straddling the window edge would not match there, so do
+        # not abort on it here either
+        if seen <= _VERDICT_SCAN_WINDOW and _EXPLICIT_POSITIVE_RE.search(window):
+            return False
+        return None
+
+    return watch
+
 
 class AIAgent(BaseAgent):
     """
@@ -78,6 +135,13 @@ class AIAgent(BaseAgent):
     Inherits common functionality from BaseAgent.
     """
 
+    __slots__ = (
+        "cache", "semantic_analyzer", "documentation_validator",
+        "semantic_code_analyzer", "semantic_code_validator",
+        "semantic_analysis", "iteration_metrics", "_executor",
+        "_file_summaries_cache",
+    )
+
     def __init__(
         self,
         directory: str,
@@ -110,6 +174,33 @@ class AIAgent(BaseAgent):
         
         self.iteration_metrics: List[Dict[str, Union[int, float]]] = []
 
+        # Shared worker pool, created when the agent is used as a context
+        # manager so repeated analyses reuse threads instead of paying pool
+        # startup/teardown per call
+        self._executor: Optional[ThreadPoolExecutor] = None
+
+        # Assembled file-summaries block, built lazily and reused across
+        # refinement iterations (see _build_file_summaries_block)
+        self._file_summaries_cache: Optional[str] = None
+
+        # Preload the model in the background for local servers so codebase
+        # analysis overlaps the VRAM load instead of the first generation
+        # call paying the cold start; cloud endpoints keep models resident
+        if os.getenv("OLLAMA_MODE", "cloud").lower() == "local":
+            threading.Thread(target=warm_model, args=(self.model,), daemon=True).start()
+
+    def __enter__(self) -> "AIAgent":
+        """Enter a managed context that owns a reusable worker pool."""
+        if self._executor is None:
+            self._executor = ThreadPoolExecutor(max_workers=32)
+        return self
+
+    def __exit__(self, exc_type, exc_val, exc_tb) -> None:
+        """Shut down the shared worker pool on context exit."""
+        if self._executor is not None:
+            self._executor.shutdown(wait=True)
+            self._executor = None
+
     def run(self, max_iterations: int = 3) -> int:
         """
         Main execution loop for the agent.
@@ -127,48 +218,66 @@ class AIAgent(BaseAgent):
         start_time = time.time()
 
         try:
-            self.validate_inputs()
-            self.analyze_codebase()
-
-            logger.info("Generating initial documentation draft...")
-            self.documentation = self.generate_documentation_draft()
-
-            for i in range(max_iterations):
-                logger.info(f"Iteration {i + 1}/{max_iterations}")
-                iteration_start = time.time()
-
-                self.critique = self.critique_documentation(self.documentation)
-                logger.info(f"Critique: {self.critique[:200]}...")
-
-                if self.is_critique_positive(self.critique):
-                    logger.info("Critique is positive. Finalizing documentation.")
-                    break
-
-                logger.info("Refining documentation based on critique...")
-                self.documentation = self.refine_documentation(
-                    self.documentation,
-                    self.critique
-                )
-
-                iteration_time = time.time() - iteration_start
-                self.iteration_metrics.append({
-                    "iteration": i + 1,
-                    "time": iteration_time,
-                    "doc_length": len(self.documentation)
-                })
-            else:
-                logger.warning("Max refinement iterations reached without positive critique.")
+            # Own the shared worker pool for the whole run so analysis (and
+            # any re-analysis) reuses threads instead of spinning up a
+            # transient pool per call
+            with self:
+                return self._run(max_iterations, start_time)
+        except Exception as e:
+            logger.exception(f"Unexpected error: {e}")
+            return 1
 
-            output_path = self.save_documentation()
+    def _run(self, max_iterations: int, start_time: float) -> int:
+        """Body of run(), executed inside the agent's managed context."""
+        self.validate_inputs()
+        self.analyze_codebase()
 
-            total_time = time.time() - start_time
-            self._log_completion_metrics(output_path, total_time)
+        logger.info("Generating initial documentation draft...")
+        self.documentation = self.generate_documentation_draft()
+        last_doc_hash = self._fingerprint(self.documentation)
 
-            return 0
+        for i in range(max_iterations):
+            logger.info(f"Iteration {i + 1}/{max_iterations}")
+            iteration_start = time.time()
 
-        except Exception as e:
-            logger.exception(f"Unexpected error: {e}")
-            return 1
+            self.critique = self.critique_documentation(self.documentation)
+            # Lazy %-formatting: skip the slice + string build entirely
+            # when INFO is disabled
+            logger.info("Critique: %.200s...", self.critique)
+
+            if self.is_critique_positive(self.critique):
+                logger.info("Critique is positive. Finalizing documentation.")
+                break
+
+            logger.info("Refining documentation based on critique...")
+            self.documentation = self.refine_documentation(
+                self.documentation,
+                self.critique
+            )
+
+            # A refinement that returns the same text has converged;
+            # further critique calls would just burn LLM round-trips
+            doc_hash = self._fingerprint(self.documentation)
+            if doc_hash == last_doc_hash:
+                logger.info("Refinement converged (documentation unchanged). Finalizing.")
+                break
+            last_doc_hash = doc_hash
+
+            iteration_time = time.time() - iteration_start
+            self.iteration_metrics.append({
+                "iteration": i + 1,
+                "time": iteration_time,
+                "doc_length": len(self.documentation)
+            })
+        else:
+            logger.warning("Max refinement iterations reached without positive critique.")
+
+        output_path = self.save_documentation()
+
+        total_time = time.time() - start_time
+        self._log_completion_metrics(output_path, total_time)
+
+        return 0
 
     def analyze_codebase(self) -> None:
         """Analyze the codebase to find and read relevant files."""
@@ -191,28 +300,53 @@ class AIAgent(BaseAgent):
 
         logger.info(f"Found {len(code_files)} files to analyze")
 
-        # Read files in parallel for better performance
+        # Read files in parallel; executor.map preserves the prioritized file
+        # order so prompts stay deterministic across runs. Each task also
+        # extracts doc comments right after its read, so that CPU work runs
+        # while sibling threads are still blocked on disk instead of as a
+        # serial pass at prompt-build time.
+        def _read_and_extract(path):
+            content = read_file_safe(path)
+            if content is None:
+                return None, None
+            return content, extract_doc_comments(path, content)
+
         file_contents = []
-        with ThreadPoolExecutor(max_workers=min(8, len(code_files))) as executor:
-            future_to_file = {
-                executor.submit(read_file_safe, file_path): file_path
-                for file_path in code_files
-            }
-            for future in as_completed(future_to_file):
-                file_path = future_to_file[future]
-                try:
-                    content = future.result()
-                    if content:
-                        rel_path = os.path.relpath(file_path, self.directory)
-                        logger.debug(f"Read: {rel_path}")
-                        file_contents.append({
-                            "path": rel_path,
-                            "content": content
-                        })
-                except Exception as e:
-                    logger.warning(f"Failed to read {file_path}: {e}")
+        if self._executor is not None:
+            results = list(self._executor.map(_read_and_extract, code_files))
+        elif len(code_files) <= 4:
+            # Below a handful of files, pool startup and join cost more than
+            # the reads themselves on a warm page cache
+            results = [_read_and_extract(path) for path in code_files]
+        else:
+            with ThreadPoolExecutor(max_workers=min(32, len(code_files))) as executor:
+                results = list(executor.map(_read_and_extract, code_files))
+
+        # Discovery returns absolute paths under self.directory, so relative
+        # paths are a prefix strip; os.path.relpath's normalization pass is
+        # kept only as the fallback for anything outside the base
+        base = str(self.directory).rstrip(os.sep) + os.sep
+        for file_path, (content, doc_comments) in zip(code_files, results):
+            if content:
+                if file_path.startswith(base):
+                    rel_path = file_path[len(base):]
+                else:
+                    rel_path = os.path.relpath(file_path, self.directory)
+                logger.debug(f"Read: {rel_path}")
+                file_contents.append({
+                    "path": rel_path,
+                    "content": content,
+                    # Truncated once here; refinement iterations reuse
+                    # this preview instead of re-slicing the full body
+                    "summary": content[:MAX_CONTENT_PREVIEW],
+                    # Pre-extracted during the parallel read; consumed by
+                    # _prepare_file_summaries
+                    "doc_comments": doc_comments,
+                })
 
         self.file_contents = file_contents
+        # New contents invalidate the assembled summaries block
+        self._file_summaries_cache = None
 
         if not self.file_contents:
             raise DocGeneratorError("No files could be read successfully.")
@@ -294,7 +428,9 @@ class AIAgent(BaseAgent):
                 enhanced_contents,
                 self.output_format,
                 self.model,
-                self.project_type
+                self.project_type,
+                use_cache=self.config.enable_caching,
+                cache=self.cache
             )
         else:
             # Fallback to original behavior if no semantic analysis
@@ -302,7 +438,9 @@ class AIAgent(BaseAgent):
                 self.file_contents,
                 self.output_format,
                 self.model,
-                self.project_type
+                self.project_type,
+                use_cache=self.config.enable_caching,
+                cache=self.cache
             )
 
     def critique_documentation(self, documentation: str) -> str:
@@ -318,27 +456,26 @@ class AIAgent(BaseAgent):
         Returns:
             Enhanced critique text with semantic analysis and validation results
         """
-        # Generate initial critique from LLM
-        prompt = DocumentationTemplates.CRITIQUE_PROMPT.format(documentation=documentation)
-        initial_critique = self._call_ollama_with_retry(prompt, operation="critique")
-        
+        # Generate the LLM critique with cross-validation overlapped: the
+        # validators depend only on the documentation, not on the critique,
+        # so they run in a worker thread while the LLM request is in flight
+        prompt = DocumentationTemplates.build_critique_prompt(documentation)
+
+        if self._executor is not None:
+            validation_future = self._executor.submit(self._validate_documentation, documentation)
+            initial_critique = self._call_ollama_with_retry(
+                prompt, operation="critique", on_token=_positive_verdict_watch())
+            all_validation_issues = validation_future.result()
+        else:
+            with ThreadPoolExecutor(max_workers=1) as executor:
+                validation_future = executor.submit(self._validate_documentation, documentation)
+                initial_critique = self._call_ollama_with_retry(
+                    prompt, operation="critique", on_token=_positive_verdict_watch())
+                all_validation_issues = validation_future.result()
+
         # Perform semantic analysis of the critique
         semantic_score = self.semantic_analyzer.analyze_critique_semantically(initial_critique)
-        
-        # Cross-validate documentation against code using both validators
-        validation_issues = []
-        semantic_validation_issues = []
-        
-        if self.documentation_validator:
-            validation_issues = self.documentation_validator.validate_documentation(documentation)
-        
-        # Use semantic code validator for enhanced validation
-        if self.semantic_code_validator:
-            semantic_validation_issues = self.semantic_code_validator.validate_documentation_semantically(documentation)
-        
-        # Combine all validation issues
-        all_validation_issues = validation_issues + semantic_validation_issues
-        
+
         # Generate enhanced critique with validation results
         enhanced_critique = self._enhance_critique_with_validation(
             initial_critique,
@@ -348,6 +485,28 @@ class AIAgent(BaseAgent):
         
         return enhanced_critique
 
+    def _validate_documentation(self, documentation: str) -> List:
+        """
+        Cross-validate documentation against code using both validators.
+
+        Args:
+            documentation: Documentation to validate
+
+        Returns:
+            Combined list of validation issues from both validators
+        """
+        validation_issues = []
+        semantic_validation_issues = []
+
+        if self.documentation_validator:
+            validation_issues = self.documentation_validator.validate_documentation(documentation)
+
+        # Use semantic code validator for enhanced validation
+        if self.semantic_code_validator:
+            semantic_validation_issues = self.semantic_code_validator.validate_documentation_semantically(documentation)
+
+        return validation_issues + semantic_validation_issues
+
     def _enhance_critique_with_validation(self, initial_critique: str,
                                         semantic_score,
                                         validation_issues: List) -> str:
@@ -362,50 +521,76 @@ class AIAgent(BaseAgent):
         Returns:
             Enhanced critique with validation insights
         """
-        critique_lines = [initial_critique.strip()]
-        
+        # Stream the enhanced critique into one buffer rather than appending
+        # per-line f-strings to a list and joining at the end
+        buf = io.StringIO()
+        buf.write(initial_critique.strip())
+
         # Add semantic analysis insights
-        critique_lines.append(f"\n## Semantic Analysis")
-        critique_lines.append(f"- Overall Quality Score: {semantic_score.overall_score:.2f}/1.00")
-        critique_lines.append(f"- Technical Accuracy: {semantic_score.technical_accuracy:.2f}")
-        critique_lines.append(f"- Completeness: {semantic_score.completeness:.2f}")
-        critique_lines.append(f"- Clarity: {semantic_score.clarity:.2f}")
-        critique_lines.append(f"- Structure: {semantic_score.structure:.2f}")
-        critique_lines.append(f"- Usefulness: {semantic_score.usefulness:.2f}")
-        critique_lines.append(f"- Confidence: {semantic_score.confidence:.2f}")
-        
+        buf.write("\n\n## Semantic Analysis")
+        buf.write(f"\n- Overall Quality Score: {semantic_score.overall_score:.2f}/1.00")
+        buf.write(f"\n- Technical Accuracy: {semantic_score.technical_accuracy:.2f}")
+        buf.write(f"\n- Completeness: {semantic_score.completeness:.2f}")
+        buf.write(f"\n- Clarity: {semantic_score.clarity:.2f}")
+        buf.write(f"\n- Structure: {semantic_score.structure:.2f}")
+        buf.write(f"\n- Usefulness: {semantic_score.usefulness:.2f}")
+        buf.write(f"\n- Confidence: {semantic_score.confidence:.2f}")
+
         # Add validation results
+        buf.write("\n\n## Cross-Validation Results")
         if validation_issues:
-            critique_lines.append(f"\n## Cross-Validation Results")
-            
-            errors = [issue for issue in validation_issues if issue.severity == ValidationResult.ERROR]
-            warnings = [issue for issue in validation_issues if issue.severity == ValidationResult.WARNING]
-            
+            errors, warnings = self._partition_issues(validation_issues)
+
             if errors:
-                critique_lines.append(f"\n### Critical Issues ({len(errors)}):")
-                for issue in errors[:5]:  # Show up to 5 critical issues
-                    critique_lines.append(f"- **{issue.issue_type}**: {issue.description}")
-                    critique_lines.append(f"  → {issue.suggested_fix}")
-                    if issue.location:
-                        critique_lines.append(f"  → Location: {issue.location}")
-            
+                buf.write(f"\n\n### Critical Issues ({len(errors)}):")
+                self._write_issues(buf, errors)
+
             if warnings:
-                critique_lines.append(f"\n### Warnings ({len(warnings)}):")
-                for issue in warnings[:5]:  # Show up to 5 warnings
-                    critique_lines.append(f"- **{issue.issue_type}**: {issue.description}")
-                    critique_lines.append(f"  → {issue.suggested_fix}")
-                    if issue.location:
-                        critique_lines.append(f"  → Location: {issue.location}")
+                buf.write(f"\n\n### Warnings ({len(warnings)}):")
+                self._write_issues(buf, warnings)
         else:
-            critique_lines.append(f"\n## Cross-Validation Results")
-            critique_lines.append("✅ No validation issues found - documentation aligns well with code structure")
-        
-        return "\n".join(critique_lines)
+            buf.write("\n✅ No validation issues found - documentation aligns well with code structure")
+
+        return buf.getvalue()
+
+    @staticmethod
+    def _partition_issues(validation_issues: List) -> tuple:
+        """
+        Split validation issues into errors and warnings in one pass.
+
+        Args:
+            validation_issues: Issues to partition by severity
+
+        Returns:
+            Tuple of (errors, warnings) lists
+        """
+        errors: List = []
+        warnings: List = []
+        for issue in validation_issues:
+            if issue.severity == ValidationResult.ERROR:
+                errors.append(issue)
+            elif issue.severity == ValidationResult.WARNING:
+                warnings.append(issue)
+        return errors, warnings
+
+    @staticmethod
+    def _write_issues(buf: io.StringIO, issues: List, limit: int = 5) -> None:
+        """Write up to limit validation issues into the critique buffer."""
+        for issue in issues[:limit]:
+            buf.write(f"\n- **{issue.issue_type}**: {issue.description}")
+            buf.write(f"\n  → {issue.suggested_fix}")
+            if issue.location:
+                buf.write(f"\n  → Location: {issue.location}")
 
     def refine_documentation(self, documentation: str, critique: str) -> str:
         """
         Refine the documentation based on critique.
 
+        Large documents are split on H2 headers and marshaled into prompts of
+        config.marshal_batch_size sections each, which are dispatched
+        concurrently and merged back together by section header. This keeps
+        individual prompts small while overlapping the network round-trips.
+
         Args:
             documentation: Current documentation
             critique: Critique to address
@@ -413,16 +598,158 @@ class AIAgent(BaseAgent):
         Returns:
             Refined documentation
         """
-        file_summaries = "\n".join([
-            f"--- File: {f['path']} ---\n{f['content'][:2000]}..."
-            for f in self.file_contents
-        ])
-        prompt = DocumentationTemplates.REFINEMENT_PROMPT.format(
-            documentation=documentation,
-            critique=critique,
-            file_summaries=file_summaries
-        )
-        return self._call_ollama_with_retry(prompt, operation="refinement")
+        prompts = self._build_refinement_prompts(documentation, critique)
+
+        if len(prompts) == 1:
+            return self._call_ollama_with_retry(prompts[0], operation="refinement")
+
+        refined_chunks = self._call_ollama_many(prompts, operation="refinement")
+        return self._merge_refined_sections(refined_chunks)
+
+    def _build_refinement_prompts(self, documentation: str, critique: str) -> List[str]:
+        """
+        Build one refinement prompt per batch of documentation sections.
+
+        The document is split on H2 headers and marshal_batch_size sections
+        are packed into each prompt, so per-prompt size stays bounded on large
+        docs instead of repeating the whole document in every request. All
+        prompts share one assembled file-summaries block.
+
+        Args:
+            documentation: Current documentation
+            critique: Critique to address
+
+        Returns:
+            List of prompts, one per marshal_batch_size group of sections
+        """
+        file_summaries = self._build_file_summaries_block()
+        sections = self._split_sections(documentation)
+        batch_size = self.config.marshal_batch_size
+
+        if len(sections) <= batch_size:
+            return [DocumentationTemplates.build_refinement_prompt(
+                documentation, critique, file_summaries
+            )]
+
+        prompts = []
+        for start in range(0, len(sections), batch_size):
+            prompts.append(DocumentationTemplates.build_refinement_prompt(
+                "\n\n".join(sections[start:start + batch_size]),
+                critique,
+                file_summaries
+            ))
+
+        return prompts
+
+    def _build_file_summaries_block(self) -> str:
+        """
+        Assemble the file-summaries reference block for refinement prompts.
+
+        The block depends only on file_contents, which is fixed after
+        analyze_codebase, so it is built once and reused by every refinement
+        iteration instead of re-sliced and re-joined per call.
+
+        Returns:
+            All file summaries concatenated into one string
+        """
+        if self._file_summaries_cache is not None:
+            return self._file_summaries_cache
+
+        # Stream summaries into one buffer instead of allocating an
+        # intermediate string per file plus a join copy per iteration
+        buf = io.StringIO()
+        for f in self.file_contents:
+            summary = f.get('summary')
+            if summary is None:
+                summary = f['content'][:MAX_CONTENT_PREVIEW]
+            buf.write("--- File: ")
+            buf.write(f['path'])
+            buf.write(" ---\n")
+            buf.write(summary)
+            buf.write("...\n")
+
+        self._file_summaries_cache = buf.getvalue()
+        return self._file_summaries_cache
+
+    @staticmethod
+    def _split_sections(documentation: str) -> List[str]:
+        """
+        Split documentation into sections on H2 headers.
+
+        Any preamble before the first H2 (title, intro) becomes its own
+        leading section so nothing is dropped on the round trip. Lines
+        inside ``` fences never open a section, so code examples whose
+        comments happen to start with "## " stay in one piece.
+
+        Args:
+            documentation: Documentation to split
+
+        Returns:
+            List of section strings in document order
+        """
+        sections: List[str] = []
+        current: List[str] = []
+        in_fence = False
+
+        for line in documentation.splitlines():
+            if line.lstrip().startswith("```"):
+                in_fence = not in_fence
+            elif not in_fence and line.startswith("## ") and current:
+                sections.append("\n".join(current))
+                current = []
+            current.append(line)
+
+        if current:
+            sections.append("\n".join(current))
+
+        return sections
+
+    @staticmethod
+    def _merge_refined_sections(refined_chunks: List[str]) -> str:
+        """
+        Merge refined documentation chunks by H2 section header.
+
+        Sections are keyed at the same granularity _split_sections uses —
+        the current H2 heading — with all subsection lines (###, ####,
+        code, prose) attached to it, so repeated subheadings like
+        "### Example" in different H2 sections never collide. Heading
+        look-alikes inside ``` fences are ignored, mirroring
+        _split_sections. Later chunks
+        override earlier ones for the same H2, while section order follows
+        first appearance. This stitches per-batch refinements back into one
+        document.
+
+        Args:
+            refined_chunks: Refined documentation from each prompt batch
+
+        Returns:
+            Merged documentation string
+        """
+        section_order: List[str] = []
+        sections: Dict[str, List[str]] = {}
+
+        for chunk in refined_chunks:
+            current_key = ""
+            in_fence = False
+            for line in chunk.splitlines():
+                if line.lstrip().startswith("```"):
+                    in_fence = not in_fence
+                elif not in_fence and line.startswith("## "):
+                    current_key = line.strip()
+                    if current_key not in sections:
+                        section_order.append(current_key)
+                    sections[current_key] = [line]
+                    continue
+                if current_key not in sections:
+                    section_order.append(current_key)
+                    sections[current_key] = []
+                sections[current_key].append(line)
+
+        merged = []
+        for key in section_order:
+            merged.extend(sections[key])
+
+        return "\n".join(merged).strip()
 
     def is_critique_positive(self, critique: str) -> bool:
         """
@@ -439,24 +766,22 @@ class AIAgent(BaseAgent):
         Returns:
             True if critique is positive based on semantic analysis and validation
         """
-        # Early exit for explicit positive statements
-        explicit_positive = [
-            "excellent and requires no changes",
-            "perfect and requires no changes",
-            "documentation is excellent",
-            "documentation is perfect",
-            "no changes needed",
-            "no improvements necessary",
-            "satisfactory as is"
-        ]
-
-        critique_lower = critique.lower().strip()
-        if any(phrase in critique_lower for phrase in explicit_positive):
+        # Early exit for explicit positive statements. The critique prompt
+        # instructs the model to open with the verdict, so only the leading
+        # window is scanned rather than the whole multi-KB critique
+        if _EXPLICIT_POSITIVE_RE.search(critique, 0, _VERDICT_SCAN_WINDOW):
             return True
 
         # Use semantic analysis instead of keyword matching
         semantic_score = self.semantic_analyzer.analyze_critique_semantically(critique)
-        
+
+        # Validation issues can only push the final score down, so when the
+        # semantic score alone cannot reach the threshold there is no point
+        # cross-validating the whole document just to fail anyway
+        if semantic_score.overall_score * semantic_score.confidence < self.config.critique_threshold:
+            logger.debug("Semantic score below threshold before validation; critique is negative")
+            return False
+
         # Cross-validate documentation if we have it
         validation_issues = []
         if self.documentation and self.documentation_validator:
@@ -471,9 +796,8 @@ class AIAgent(BaseAgent):
         logger.debug(f"Final score: {final_score:.3f} (threshold: {self.config.critique_threshold})")
         
         # Consider critique positive if score meets threshold and no critical errors
-        critical_errors = [issue for issue in validation_issues
-                          if issue.severity == ValidationResult.ERROR]
-        
+        critical_errors, _ = self._partition_issues(validation_issues)
+
         return final_score >= self.config.critique_threshold and len(critical_errors) == 0
 
     def save_documentation(self) -> str:
@@ -488,13 +812,20 @@ class AIAgent(BaseAgent):
             output_dir=self.directory / "output"
         )
 
-    def _call_ollama_with_retry(self, prompt: str, operation: str = "generation") -> str:
+    def _call_ollama_with_retry(self, prompt: str, operation: str = "generation",
+                                on_token=None) -> str:
         """
         Call Ollama API with exponential backoff retry logic and caching.
 
+        Responses are streamed by the API layer; passing on_token lets a
+        caller consume tokens while the model is still generating (e.g. to
+        watch for section boundaries) instead of waiting for the full body.
+
         Args:
             prompt: Prompt to send
             operation: Description of the operation (for logging)
+            on_token: Optional per-token callback; returning False aborts
+                the stream early
 
         Returns:
             API response text
@@ -503,7 +834,7 @@ class AIAgent(BaseAgent):
             DocGeneratorError: If all retries fail
         """
         # Use utility function for API calls with caching
-        return call_ollama_api(
+        kwargs = dict(
             prompt=prompt,
             model=self.model,
             max_retries=self.config.max_retries,
@@ -512,6 +843,49 @@ class AIAgent(BaseAgent):
             use_cache=self.config.enable_caching,
             cache=self.cache if self.cache else None
         )
+        if operation == "critique":
+            # Critique optionally runs on a lighter (quantized) model;
+            # refinement keeps the full-precision one
+            if self.config.critique_model:
+                kwargs["model"] = self.config.critique_model
+        if on_token is not None:
+            kwargs["on_token"] = on_token
+        return call_ollama_api(**kwargs)
+
+    def _call_ollama_many(self, prompts: List[str], operation: str = "generation") -> List[str]:
+        """
+        Call Ollama API for several prompts concurrently via aiohttp.
+
+        Network I/O for all prompts is overlapped with asyncio.gather, so a
+        batch completes in roughly the time of its slowest call. Responses are
+        returned in prompt order.
+
+        Args:
+            prompts: Prompts to send
+            operation: Description of the operation (for logging)
+
+        Returns:
+            List of API response texts, one per prompt
+
+        Raises:
+            DocGeneratorError: If any prompt fails after all retries
+        """
+        logger.info(f"Dispatching {len(prompts)} concurrent {operation} prompts")
+        return call_ollama_api_many(
+            prompts=prompts,
+            model=self.model,
+            max_retries=self.config.max_retries,
+            retry_delay=self.config.retry_delay,
+            api_timeout=self.config.api_timeout,
+            use_cache=self.config.enable_caching,
+            cache=self.cache if self.cache else None,
+            max_concurrency=self.config.max_concurrency
+        )
+
+    @staticmethod
+    def _fingerprint(documentation: str) -> bytes:
+        """Cheap content fingerprint used to detect converged refinements."""
+        return hashlib.blake2b(documentation.encode('utf-8'), digest_size=8).digest()
 
     def _log_completion_metrics(self, output_path: str, total_time: float):
         """Log completion statistics."""
@@ -7,11 +7,13 @@ critique, and refine technical documentation.
 """
 
 import logging
+import re
 from abc import ABC, abstractmethod
 import os
 from pathlib import Path
 from typing import List, Dict, Optional, Any
 from dataclasses import dataclass, field
+from functools import lru_cache
 
 logger = logging.getLogger(__name__)
 
@@ -36,6 +38,31 @@ class GenerationError(AgentError):
     pass
 
 
+# Memoized environment parsing: AgentConfig instances are created per agent
+# (and per graph run), and the underlying environment almost never changes
+# mid-process. Caching the parsed values keeps repeated construction free;
+# AgentConfig.reload_env() drops the caches when the environment does change.
+
+@lru_cache(maxsize=None)
+def _env_str(name: str, default: str) -> str:
+    return os.getenv(name, default)
+
+
+@lru_cache(maxsize=None)
+def _env_int(name: str, default: str) -> int:
+    return int(os.getenv(name, default))
+
+
+@lru_cache(maxsize=None)
+def _env_float(name: str, default: str) -> float:
+    return float(os.getenv(name, default))
+
+
+@lru_cache(maxsize=None)
+def _env_bool(name: str, default: str) -> bool:
+    return os.getenv(name, default).lower() == "true"
+
+
 @dataclass
 class AgentConfig:
     """
@@ -44,32 +71,53 @@ class AgentConfig:
     This class holds all configuration parameters for the AI agent, with values
     loaded from environment variables by default. It includes validation to ensure
     all parameters are within acceptable ranges.
+
+    Note: the dataclass stays unslotted because field() assignments in the
+    class body conflict with __slots__ until dataclass(slots=True) is
+    available (Python 3.10+); the agent classes carry the slots instead.
     """
 
-    max_retries: int = field(default_factory=lambda: int(os.getenv("MAX_RETRIES", "3")))
+    max_retries: int = field(default_factory=lambda: _env_int("MAX_RETRIES", "3"))
     """Maximum number of retry attempts for API calls."""
     
-    retry_delay: int = field(default_factory=lambda: int(os.getenv("RETRY_DELAY", "2")))
+    retry_delay: int = field(default_factory=lambda: _env_int("RETRY_DELAY", "2"))
     """Base delay in seconds between retry attempts (exponential backoff)."""
     
-    critique_threshold: float = field(default_factory=lambda: float(os.getenv("CRITIQUE_THRESHOLD", "0.8")))
+    critique_threshold: float = field(default_factory=lambda: _env_float("CRITIQUE_THRESHOLD", "0.8"))
     """Threshold score (0.0-1.0) for determining if critique is satisfactory."""
     
-    enable_caching: bool = field(default_factory=lambda: os.getenv("ENABLE_CACHING", "true").lower() == "true")
+    enable_caching: bool = field(default_factory=lambda: _env_bool("ENABLE_CACHING", "true"))
     """Whether to enable response caching to avoid redundant API calls."""
     
-    cache_dir: str = field(default_factory=lambda: os.getenv("CACHE_DIR", ".cache"))
+    cache_dir: str = field(default_factory=lambda: _env_str("CACHE_DIR", ".cache"))
     """Directory for storing cached API responses."""
     
-    cache_max_age_hours: int = field(default_factory=lambda: int(os.getenv("CACHE_MAX_AGE_HOURS", "24")))
+    cache_max_age_hours: int = field(default_factory=lambda: _env_int("CACHE_MAX_AGE_HOURS", "24"))
     """Maximum age in hours for cached responses before expiration."""
     
-    cache_max_entries: int = field(default_factory=lambda: int(os.getenv("CACHE_MAX_ENTRIES", "100")))
+    cache_max_entries: int = field(default_factory=lambda: _env_int("CACHE_MAX_ENTRIES", "100"))
     """Maximum number of entries to keep in the cache."""
     
-    api_timeout: int = field(default_factory=lambda: int(os.getenv("API_TIMEOUT", "300")))
+    api_timeout: int = field(default_factory=lambda: _env_int("API_TIMEOUT", "300"))
     """Timeout in seconds for API requests."""
 
+    marshal_batch_size: int = field(default_factory=lambda: _env_int("MARSHAL_BATCH_SIZE", "4"))
+    """Number of H2 documentation sections batched into each refinement prompt."""
+
+    critique_model: str = field(default_factory=lambda: _env_str("CRITIQUE_MODEL", ""))
+    """Optional lighter model (e.g. a Q4_K_M quant) used only for critique.
+
+    Critique is closer to classification than generation and tolerates
+    quantization well; empty string means critique runs on the main model.
+    Set OLLAMA_MAX_LOADED_MODELS to at least 2 so both stay resident."""
+
+    max_concurrency: int = field(default_factory=lambda: _env_int(
+        "MAX_CONCURRENCY", os.getenv("OLLAMA_NUM_PARALLEL", "4")))
+    """Initial number of concurrent in-flight LLM requests for batched calls.
+
+    Defaults to OLLAMA_NUM_PARALLEL when MAX_CONCURRENCY is unset, so the
+    client window matches the server's configured parallelism."""
+
     def __post_init__(self):
         """Validate configuration values."""
         if self.max_retries < 0:
@@ -84,6 +132,23 @@ class AgentConfig:
             raise ConfigurationError("cache_max_age_hours must be non-negative")
         if self.cache_max_entries < 0:
             raise ConfigurationError("cache_max_entries must be non-negative")
+        if self.marshal_batch_size < 1:
+            raise ConfigurationError("marshal_batch_size must be positive")
+        if self.max_concurrency < 1:
+            raise ConfigurationError("max_concurrency must be positive")
+
+    @staticmethod
+    def reload_env():
+        """
+        Drop the memoized environment values.
+
+        Call after mutating os.environ (tests, REPL reconfiguration) so the
+        next AgentConfig construction re-reads the environment.
+        """
+        _env_str.cache_clear()
+        _env_int.cache_clear()
+        _env_float.cache_clear()
+        _env_bool.cache_clear()
 
     def __repr__(self) -> str:
         return (f"AgentConfig(max_retries={self.max_retries}, "
@@ -98,8 +163,16 @@ class BaseAgent(ABC):
 
     Provides common functionality for analyzing codebases, generating documentation,
     and managing the refinement process.
+
+    Slotted: attribute reads like config/model are hot in the retry loop,
+    and fixed slots are both faster and leaner than a per-instance __dict__.
     """
 
+    __slots__ = (
+        "directory", "max_files", "model", "project_type", "output_format",
+        "output_file", "config", "file_contents", "documentation", "critique",
+    )
+
     def __init__(
         self,
         directory: str,
@@ -227,10 +300,52 @@ Instructions:
 Refined Documentation:
 """
 
+    # Templates are split at their placeholders once at class creation;
+    # prompt assembly then splices the (potentially multi-KB) values with a
+    # single join instead of str.format rescanning the whole template
+    _CRITIQUE_PARTS = CRITIQUE_PROMPT.split("{documentation}")
+    _REFINEMENT_PARTS = re.split(
+        r"\{(?:documentation|critique|file_summaries)\}", REFINEMENT_PROMPT
+    )
+
+    @staticmethod
+    def build_critique_prompt(documentation: str) -> str:
+        """
+        Assemble the critique prompt for a documentation draft.
+
+        Args:
+            documentation: Documentation to critique
+
+        Returns:
+            Complete critique prompt
+        """
+        pre, post = DocumentationTemplates._CRITIQUE_PARTS
+        return "".join((pre, documentation, post))
+
+    @staticmethod
+    def build_refinement_prompt(documentation: str, critique: str, file_summaries: str) -> str:
+        """
+        Assemble the refinement prompt from its three inputs.
+
+        Args:
+            documentation: Current documentation (or a section batch of it)
+            critique: Critique to address
+            file_summaries: File summaries reference block
+
+        Returns:
+            Complete refinement prompt
+        """
+        p = DocumentationTemplates._REFINEMENT_PARTS
+        return "".join((p[0], documentation, p[1], critique, p[2], file_summaries, p[3]))
+
     @staticmethod
+    @lru_cache(maxsize=None)
     def get_project_description(project_type: str) -> str:
         """
         Get project-specific description for documentation generation.
+
+        Memoized: the lookup dict below is a literal rebuilt per call, and
+        the three project types mean at most three cached entries.
         
         Args:
             project_type: Type of project ('frontend', 'backend', or 'mixed')
@@ -266,9 +381,12 @@ client-side and server-side architecture, their integration, and communication p
         return descriptions.get(project_type, descriptions["mixed"])
 
     @staticmethod
+    @lru_cache(maxsize=None)
     def get_format_instructions(output_format: str) -> str:
         """
         Get format-specific instructions for documentation generation.
+
+        Memoized for the same reason as get_project_description.
         
         Args:
             output_format: Desired output format ('markdown', 'html', or 'pdf')
@@ -283,29 +401,7 @@ client-side and server-side architecture, their integration, and communication p
         }
         return instructions.get(output_format.lower(), instructions["markdown"])
 
-    @staticmethod
-    def build_generation_prompt(
-        file_summaries: str,
-        docstring_info: str,
-        output_format: str,
-        project_type: str
-    ) -> str:
-        """
-        Build the main documentation generation prompt.
-        
-        Args:
-            file_summaries: Summaries of code files to document
-            docstring_info: Extracted docstrings and JSDocs from code
-            output_format: Desired output format
-            project_type: Type of project being documented
-            
-        Returns:
-            Complete prompt for documentation generation
-        """
-        project_intro = DocumentationTemplates.get_project_description(project_type)
-        format_instructions = DocumentationTemplates.get_format_instructions(output_format)
-
-        return f"""
+    GENERATION_PROMPT = """
 {project_intro}
 
 {format_instructions}
@@ -358,11 +454,11 @@ For each significant file (prioritize important files):
 
 Here are the code files to analyze:
 
-{file_summaries}
+{{file_summaries}}
 
 Here are extracted documentation comments:
 
-{docstring_info}
+{{docstring_info}}
 
 IMPORTANT:
 - Provide specific, actionable information
@@ -371,4 +467,49 @@ IMPORTANT:
 - Be concise but comprehensive
 - Do not include any backticks or code block markers in your response
 - Do not use phrases like "This is a placeholder" or "This is a sample"
-""".strip()
+"""
+    """Main generation prompt; dynamic slots are spliced in by _generation_prompt_parts."""
+
+    @staticmethod
+    def build_generation_prompt(
+        file_summaries: str,
+        docstring_info: str,
+        output_format: str,
+        project_type: str
+    ) -> str:
+        """
+        Build the main documentation generation prompt.
+        
+        Args:
+            file_summaries: Summaries of code files to document
+            docstring_info: Extracted docstrings and JSDocs from code
+            output_format: Desired output format
+            project_type: Type of project being documented
+            
+        Returns:
+            Complete prompt for documentation generation
+        """
+        head, mid, tail = DocumentationTemplates._generation_prompt_parts(
+            project_type, output_format
+        )
+        return "".join((head, file_summaries, mid, docstring_info, tail))
+
+    @staticmethod
+    @lru_cache(maxsize=None)
+    def _generation_prompt_parts(project_type: str, output_format: str) -> tuple:
+        """
+        Resolve the static generation-prompt fragments for a type/format pair.
+
+        The ~2 KB section skeleton plus the project and format blurbs never
+        change between calls with the same arguments, so they are filled in
+        and split around the two dynamic slots once; build_generation_prompt
+        then assembles the final prompt with a single join. The edge strips
+        reproduce the .strip() the old f-string applied to the whole prompt.
+        """
+        filled = DocumentationTemplates.GENERATION_PROMPT.format(
+            project_intro=DocumentationTemplates.get_project_description(project_type),
+            format_instructions=DocumentationTemplates.get_format_instructions(output_format),
+        )
+        head, rest = filled.split("{file_summaries}")
+        mid, tail = rest.split("{docstring_info}")
+        return head.lstrip(), mid, tail.rstrip()
@@ -6,10 +6,12 @@ Automatically generates comprehensive documentation for code projects using Olla
 Supports multiple output formats (Markdown, HTML, PDF) and intelligent file prioritization.
 """
 
+import io
 import os
-import re
 import logging
-from datetime import datetime
+import threading
+import time
+import zlib
 from pathlib import Path
 from typing import Dict, List, Optional, Tuple
 
@@ -22,16 +24,41 @@ logger = logging.getLogger(__name__)
 try:
     from .base_agent import DocumentationTemplates  # noqa: E402
     from .utils.file_utils import find_code_files, read_file_safe, detect_project_type, MAX_CONTENT_PREVIEW  # noqa: E402
-    from .utils.text_utils import extract_docstrings, extract_jsdoc, clean_markdown_response  # noqa: E402
+    from .utils.text_utils import extract_docstrings, extract_jsdoc, extract_doc_comments, clean_markdown_response  # noqa: E402
     from .utils.api_utils import ResponseCache, call_ollama_api, get_ollama_headers, OLLAMA_API_URL, MODEL_NAME, API_TIMEOUT  # noqa: E402
 except ImportError:
     from base_agent import DocumentationTemplates  # noqa: E402
     from utils.file_utils import find_code_files, read_file_safe, detect_project_type, MAX_CONTENT_PREVIEW  # noqa: E402
-    from utils.text_utils import extract_docstrings, extract_jsdoc, clean_markdown_response  # noqa: E402
+    from utils.text_utils import extract_docstrings, extract_jsdoc, extract_doc_comments, clean_markdown_response  # noqa: E402
     from utils.api_utils import ResponseCache, call_ollama_api, get_ollama_headers, OLLAMA_API_URL, MODEL_NAME, API_TIMEOUT  # noqa: E402
 
 load_dotenv()
 
+# Shared converter: building the Markdown state machine (extension loading,
+# pattern compilation) is the expensive part, so do it once at import.
+_MD = markdown.Markdown(extensions=['extra', 'codehilite', 'toc'])
+
+_DEFAULT_CACHE: Optional[ResponseCache] = None
+_DEFAULT_CACHE_LOCK = threading.Lock()
+
+
+def _get_default_cache() -> ResponseCache:
+    """
+    Lazily create the shared default ResponseCache.
+
+    Constructing a ResponseCache opens the SQLite database and runs a
+    startup eviction sweep; doing that once per process instead of once
+    per generate_documentation call matters for batch runs and the agent
+    loop. Callers that pass their own cache bypass this entirely.
+    """
+    global _DEFAULT_CACHE
+    if _DEFAULT_CACHE is None:
+        with _DEFAULT_CACHE_LOCK:
+            if _DEFAULT_CACHE is None:
+                _DEFAULT_CACHE = ResponseCache()
+    return _DEFAULT_CACHE
+
+
 class DocGeneratorError(Exception):
     """Base exception for documentation generator errors."""
     pass
@@ -49,107 +76,172 @@ def build_prompt(file_summaries: str, docstring_info: str, output_format: str, p
     )
 
 
-def _prepare_file_summaries(file_contents: List[Dict[str, str]]) -> Tuple[List[str], List[str]]:
-    """Prepare file summaries and docstring info from file contents."""
-    file_summaries: List[str] = []
-    docstring_info: List[str] = []
-    
+def _prepare_file_summaries(file_contents: List[Dict[str, str]]) -> Tuple[str, str]:
+    """
+    Prepare file summary and docstring blocks from file contents.
+
+    Both blocks are assembled in single streaming passes through StringIO
+    buffers — the old list-of-fragments approach materialized every
+    per-file f-string plus a full joined copy of each block, which on
+    large codebases meant several megabyte-scale intermediate strings.
+    """
+    summaries = io.StringIO()
+    docstrings_buf = io.StringIO()
+
     for file_info in file_contents:
         path = file_info['path']
         content = file_info['content']
-        
-        content_preview = content[:MAX_CONTENT_PREVIEW]
+
+        if summaries.tell():
+            summaries.write("\n")
+        summaries.write("--- File: ")
+        summaries.write(path)
+        summaries.write(" ---\n")
         if len(content) > MAX_CONTENT_PREVIEW:
-            content_preview += "..."
-        
-        file_summaries.append(f"--- File: {path} ---\n{content_preview}")
-        
-        if path.endswith('.py'):
-            docstrings = extract_docstrings(content)
-            if docstrings:
-                docstring_info.append(f"--- Docstrings from {path} ---")
-                docstring_info.extend(f"{k}: {v}" for k, v in docstrings.items())
-        
-        elif path.endswith(('.js', '.ts', '.tsx', '.jsx')):
-            jsdocs = extract_jsdoc(content)
-            if jsdocs:
-                docstring_info.append(f"--- JSDoc from {path} ---")
-                docstring_info.extend(f"{k}: {v}" for k, v in jsdocs.items())
-    
-    return file_summaries, docstring_info
+            summaries.write(content[:MAX_CONTENT_PREVIEW])
+            summaries.write("...")
+        else:
+            # Slicing copies even when it spans the whole string; most
+            # source files fit under the preview cap, so write them as-is.
+            summaries.write(content)
+
+        # The agent's read phase pre-extracts doc comments while other
+        # reads are still in flight; fall back to extracting here for
+        # callers that hand over bare path/content dicts
+        if 'doc_comments' in file_info:
+            extracted = file_info['doc_comments']
+        else:
+            extracted = extract_doc_comments(path, content)
+        if extracted:
+            label, entries = extracted
+            if docstrings_buf.tell():
+                docstrings_buf.write("\n")
+            docstrings_buf.write(f"--- {label} from {path} ---")
+            for k, v in entries.items():
+                docstrings_buf.write(f"\n{k}: {v}")
+
+    return summaries.getvalue(), docstrings_buf.getvalue()
+
+
+def _content_fingerprint(
+    file_contents: List[Dict[str, str]],
+    output_format: str,
+    project_type: str
+) -> str:
+    """
+    Build a structured cache key from file contents instead of the full prompt.
+
+    Hashing the assembled prompt makes every single-byte edit a cache miss.
+    Keying on per-file digests of whitespace-normalized content means
+    formatting-only changes (and prompt-template wording tweaks) still hit
+    the cache, while any real content change busts it. Paths are sorted so
+    the key is independent of discovery order.
+
+    Args:
+        file_contents: List of dicts with 'path' and 'content' keys
+        output_format: Output format the prompt targets
+        project_type: Project type the prompt targets
+
+    Returns:
+        Canonical key string for ResponseCache lookups
+    """
+    digests = []
+    for file_info in file_contents:
+        # crc32 over the whitespace-normalized content: the checksum is not
+        # adversarial here (keys are local and path-labelled) and zlib's C
+        # loop beats a cryptographic hash. split() has already materialized
+        # the tokens, so one join + one crc32 call stays in C for the whole
+        # file. The token count is a cheap second discriminator.
+        tokens = file_info['content'].split()
+        crc = zlib.crc32(" ".join(tokens).encode("utf-8"))
+        digests.append(f"{file_info['path']}:{crc:08x}:{len(tokens)}")
+    return f"doc:{output_format}:{project_type}:" + "\n".join(sorted(digests))
 
 
 def generate_documentation(
-    file_contents: List[Dict[str, str]], 
+    file_contents: List[Dict[str, str]],
     output_format: str = "markdown",
     model: str = MODEL_NAME,
-    project_type: str = "mixed"
+    project_type: str = "mixed",
+    use_cache: bool = True,
+    cache: Optional[ResponseCache] = None
 ) -> str:
     """
     Generate documentation using Ollama API.
-    
+
     Args:
         file_contents: List of dicts with 'path' and 'content' keys
         output_format: Output format (markdown, html, pdf)
         model: Ollama model name
         project_type: Project type (frontend, backend, mixed)
-        
+        use_cache: Whether to use response caching
+        cache: Cache instance to reuse; a default one is created when caching
+            is enabled and no instance is supplied
+
     Returns:
         Generated documentation string
-        
+
     Raises:
         DocGeneratorError: If documentation generation fails
     """
     if not file_contents:
         raise DocGeneratorError("No code files to document")
-    
+
+    fingerprint = None
+    if use_cache:
+        if cache is None:
+            cache = _get_default_cache()
+        fingerprint = _content_fingerprint(file_contents, output_format, project_type)
+        cached = cache.get(fingerprint, model)
+        if cached:
+            logger.info("Using cached documentation (content fingerprint hit)")
+            return cached
+
     file_summaries, docstring_info = _prepare_file_summaries(file_contents)
-    
+
     prompt = build_prompt(
-        "\n".join(file_summaries),
-        "\n".join(docstring_info),
+        file_summaries,
+        docstring_info,
         output_format,
         project_type
     )
-    
+
     logger.info(f"Sending request to Ollama API (model: {model})")
     logger.debug(f"Prompt: {len(prompt)} chars (~{len(prompt) // 4} tokens)")
-    
-    # Use the utility function for API calls with caching
-    cache = ResponseCache()  # Use default settings or load from config
+
+    # Caching is handled here against the content fingerprint, so the raw
+    # API call runs uncached to avoid a redundant exact-prompt entry.
     doc = call_ollama_api(
         prompt=prompt,
         model=model,
         max_retries=3,
         retry_delay=2,
         api_timeout=API_TIMEOUT,
-        use_cache=True,
-        cache=cache
+        use_cache=False,
+        cache=None
     )
-    
+
     # Clean the response
     doc = clean_markdown_response(doc)
-    
+
+    if use_cache and cache is not None and fingerprint is not None:
+        cache.set(fingerprint, model, doc)
+
     logger.info("Documentation generated successfully")
     return doc
 
 
-def convert_markdown_to_html(markdown: str) -> str:
+def convert_markdown_to_html(markdown_text: str) -> str:
     """
-    Simple markdown to HTML conversion.
-    
-    Note: For production use, consider using a library like markdown2 or python-markdown.
+    Convert markdown to HTML using the shared python-markdown instance.
+
+    The previous hand-rolled chain of re.sub passes recompiled its patterns
+    on every call and was vulnerable to backtracking on the DOTALL list
+    grouping; the compiled Markdown instance is reused (reset between
+    documents) and produces well-formed HTML.
     """
-    html = markdown
-    
-    html = re.sub(r'^# (.*?)$', r'<h1>\1</h1>', html, flags=re.MULTILINE)
-    html = re.sub(r'^## (.*?)$', r'<h2>\1</h2>', html, flags=re.MULTILINE)
-    html = re.sub(r'^### (.*?)$', r'<h3>\1</h3>', html, flags=re.MULTILINE)
-    html = re.sub(r'^- (.*?)$', r'<li>\1</li>', html, flags=re.MULTILINE)
-    html = re.sub(r'(<li>.*?</li>\n)+', r'<ul>\n\g<0></ul>', html, flags=re.DOTALL)
-    html = re.sub(r'(?<!\n)\n(?!\n)(?!<[uo]l|<li|<h[1-6])', r'<br>', html)
-    html = re.sub(r'(?<!\n)\n\n(?!<[uo]l|<li|<h[1-6])', r'</p>\n\n<p>', html)
-    
+    html = _MD.reset().convert(markdown_text)
+
     return f"""<!DOCTYPE html>
 <html lang="en">
 <head>
@@ -172,18 +264,32 @@ def convert_markdown_to_html(markdown: str) -> str:
     </style>
 </head>
 <body>
-    <p>{html}</p>
+{html}
 </body>
 </html>
 """
 
 
+_PDFKIT_CONFIG = None
+
+
+def _get_pdfkit_config():
+    """
+    Locate wkhtmltopdf once and reuse the configuration.
+
+    pdfkit.from_string without an explicit configuration re-runs the
+    wkhtmltopdf path lookup (a subprocess/PATH search) on every call,
+    which adds up in batch PDF runs.
+    """
+    global _PDFKIT_CONFIG
+    if _PDFKIT_CONFIG is None:
+        _PDFKIT_CONFIG = pdfkit.configuration()
+    return _PDFKIT_CONFIG
+
+
 def convert_to_pdf(markdown_content: str, output_path: str) -> None:
     """Convert markdown content to PDF using pdfkit."""
-    html_content = markdown.markdown(
-        markdown_content,
-        extensions=['extra', 'codehilite', 'toc']
-    )
+    html_content = _MD.reset().convert(markdown_content)
     
     styled_html = f"""<!DOCTYPE html>
 <html lang="en">
@@ -217,7 +323,7 @@ def convert_to_pdf(markdown_content: str, output_path: str) -> None:
     pdfkit.from_string(styled_html, output_path, options={
         'encoding': 'UTF-8',
         'enable-local-file-access': None
-    })
+    }, configuration=_get_pdfkit_config())
 
 
 def save_documentation(content: str, output_format: str, output_file: Optional[str] = None, output_dir: Optional[Path] = None) -> str:
@@ -243,15 +349,18 @@ def save_documentation(content: str, output_format: str, output_file: Optional[s
         logger.error(f"Failed to create output directory {output_dir}: {e}")
         raise DocGeneratorError(f"Cannot create output directory: {e}")
 
-    timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
+    # time.strftime over gmtime skips datetime object construction and
+    # the local-timezone lookup; UTC also keeps filenames unambiguous
+    timestamp = time.strftime("%Y%m%d_%H%M%S", time.gmtime())
     base_name = output_file.rsplit('.', 1)[0] if output_file else f"documentation_{timestamp}"
 
     try:
         if output_format.lower() == "html":
             filename = output_dir / f"{base_name}.html"
             final_content = convert_markdown_to_html(content)
-            with open(filename, "w", encoding="utf-8") as f:
-                f.write(final_content)
+            # write_bytes issues one bulk write with no text-layer codec
+            # or newline translation; markdown/html need neither
+            filename.write_bytes(final_content.encode("utf-8"))
         elif output_format.lower() == "pdf":
             filename = output_dir / f"{base_name}.pdf"
             try:
@@ -260,13 +369,11 @@ def save_documentation(content: str, output_format: str, output_file: Optional[s
             except Exception as e:
                 logger.warning(f"PDF generation failed: {e}. Falling back to Markdown format...")
                 filename = output_dir / f"{base_name}.md"
-                with open(filename, "w", encoding="utf-8") as f:
-                    f.write(content)
+                filename.write_bytes(content.encode("utf-8"))
                 logger.info("Note: Install wkhtmltopdf for PDF support: https://wkhtmltopdf.org/downloads.html")
         else:
             filename = output_dir / f"{base_name}.md"
-            with open(filename, "w", encoding="utf-8") as f:
-                f.write(content)
+            filename.write_bytes(content.encode("utf-8"))
     except OSError as e:
         logger.error(f"Failed to write documentation to {filename}: {e}")
         raise DocGeneratorError(f"Cannot write documentation file: {e}")
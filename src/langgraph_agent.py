@@ -8,8 +8,11 @@ documentation for code projects using a stateful graph managed by LangGraph.
 
 import os
 import sys
+import atexit
 import argparse
 import logging
+import queue
+from logging.handlers import QueueHandler, QueueListener
 from pathlib import Path
 from typing import List, Dict, Optional, TypedDict
 from langgraph.graph import StateGraph, END
@@ -23,14 +26,24 @@ from .utils.semantic_code_analyzer import SemanticCodeAnalyzer
 load_dotenv()
 
 # --- Logging Setup ---
+# Records are pushed onto a queue and written by a background listener
+# thread, so console/file I/O never stalls the calling thread (or the
+# event loop during async fan-out) on the hot path
+_log_queue: queue.Queue = queue.Queue(-1)
+_log_listener = QueueListener(
+    _log_queue,
+    logging.StreamHandler(sys.stdout),
+    logging.FileHandler('langgraph_agent.log', encoding='utf-8'),
+    respect_handler_level=True
+)
 logging.basicConfig(
     level=logging.INFO,
     format='%(asctime)s - %(name)s - %(levelname)s - %(message)s',
-    handlers=[
-        logging.StreamHandler(sys.stdout),
-        logging.FileHandler('langgraph_agent.log', encoding='utf-8')
-    ]
+    handlers=[QueueHandler(_log_queue)]
 )
+_log_listener.start()
+atexit.register(_log_listener.stop)
+
 logger = logging.getLogger(__name__)
 
 
@@ -75,8 +88,11 @@ def analyze_codebase(state: AgentState) -> AgentState:
         config=state['config']
     )
 
-    # Analyze the codebase using the agent's method
-    agent.analyze_codebase()
+    # Analyze the codebase using the agent's method. The managed context
+    # provides the shared worker pool for the parallel file reads and is
+    # torn down again before the agent is stashed in the graph state
+    with agent:
+        agent.analyze_codebase()
 
     return {
         **state,
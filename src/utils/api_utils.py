@@ -1,13 +1,34 @@
 """API utilities for the AI Documentation Agent."""
 
 import os
+import asyncio
 import logging
+import random
+import sqlite3
+import threading
 import time
 import hashlib
 import json
+import zlib
 from pathlib import Path
-from typing import Dict, List, Optional
-import requests
+from functools import lru_cache
+from typing import Callable, Dict, List, Optional
+
+import aiohttp
+import httpx
+
+try:
+    import orjson
+
+    def _json_dumps(obj) -> bytes:
+        return orjson.dumps(obj)
+
+    _json_loads = orjson.loads
+except ImportError:  # pragma: no cover - stdlib fallback
+    def _json_dumps(obj) -> bytes:
+        return json.dumps(obj, separators=(',', ':')).encode('utf-8')
+
+    _json_loads = json.loads
 
 logger = logging.getLogger(__name__)
 
@@ -20,6 +41,33 @@ else:
 
 MODEL_NAME = os.getenv("MODEL_NAME", "gpt-oss:120b-cloud")
 API_TIMEOUT = int(os.getenv("API_TIMEOUT", "300"))
+MAX_KEEPALIVE_CONNECTIONS = int(os.getenv("MAX_KEEPALIVE_CONNECTIONS", "16"))
+OLLAMA_NUM_PARALLEL = int(os.getenv("OLLAMA_NUM_PARALLEL", "4"))
+OLLAMA_TARGET_LATENCY = float(os.getenv("OLLAMA_TARGET_LATENCY", "20"))
+OLLAMA_KEEP_ALIVE = os.getenv("OLLAMA_KEEP_ALIVE", "1h")
+OLLAMA_HEDGE_DELAY = float(os.getenv("OLLAMA_HEDGE_DELAY", "0"))
+
+# Module-level client so TCP/TLS handshakes are paid once and connections are
+# kept alive (HTTP/2) across all API calls in a run
+_HTTP = httpx.Client(
+    http2=True,
+    timeout=API_TIMEOUT,
+    limits=httpx.Limits(
+        max_connections=MAX_KEEPALIVE_CONNECTIONS,
+        max_keepalive_connections=MAX_KEEPALIVE_CONNECTIONS
+    )
+)
+
+
+def _backoff_delay(retry_delay: int, attempt: int) -> float:
+    """
+    Bounded exponential backoff with jitter.
+
+    The cap keeps late attempts from sleeping for minutes, and the jitter
+    de-synchronizes concurrent callers so a briefly overloaded server is
+    not hit by a retry storm in lockstep.
+    """
+    return min(60.0, retry_delay * (2 ** attempt)) * random.uniform(0.5, 1.5)
 
 
 class DocGeneratorError(Exception):
@@ -27,8 +75,16 @@ class DocGeneratorError(Exception):
     pass
 
 
+@lru_cache(maxsize=1)
 def get_ollama_headers() -> Dict[str, str]:
-    """Build request headers with optional API key authentication."""
+    """
+    Build request headers with optional API key authentication.
+
+    Memoized: headers depend only on the OLLAMA_API_KEY environment variable,
+    so the dict construction and env lookup are paid once rather than on
+    every retry attempt. Call get_ollama_headers.cache_clear() if the key
+    changes mid-process.
+    """
     headers = {"Content-Type": "application/json"}
     api_key = os.getenv("OLLAMA_API_KEY")
     
@@ -38,13 +94,45 @@ def get_ollama_headers() -> Dict[str, str]:
     return headers
 
 
+def warm_model(model: str) -> None:
+    """
+    Fire a warm-up request so the model is resident before the first real call.
+
+    An empty prompt makes Ollama load the model weights and hold them for
+    OLLAMA_KEEP_ALIVE without generating anything, taking the multi-second
+    cold start off the first draft generation. Failures are logged and
+    swallowed — warming is purely opportunistic.
+
+    Args:
+        model: The model to preload
+    """
+    try:
+        _HTTP.post(
+            OLLAMA_API_URL,
+            content=_json_dumps({
+                "model": model,
+                "prompt": "",
+                "keep_alive": OLLAMA_KEEP_ALIVE,
+            }),
+            headers=get_ollama_headers(),
+            timeout=30
+        )
+        logger.info(f"Model {model} warm-up request sent")
+    except httpx.HTTPError as e:
+        logger.debug(f"Model warm-up failed: {e}")
+
+
 class ResponseCache:
     """
-    Simple file-based cache for API responses.
-    
-    This class provides a file-based caching mechanism to store and retrieve
-    API responses, reducing redundant calls to the LLM API and speeding up
-    repeated documentation generations.
+    SQLite-backed cache for API responses.
+
+    This class provides a caching mechanism to store and retrieve API
+    responses, reducing redundant calls to the LLM API and speeding up
+    repeated documentation generations. Entries live in a single SQLite
+    database in WAL mode, so reads and writes are one indexed statement
+    each instead of per-entry JSON files plus a directory scan on every
+    write. Responses are stored zlib-compressed — markdown compresses
+    4-6x, which keeps the database small and cuts bytes read on hits.
     """
 
     def __init__(self, cache_dir: str = ".cache", max_age_hours: int = 24, max_entries: int = 100):
@@ -53,119 +141,147 @@ class ResponseCache:
         self.max_age_hours = max_age_hours
         self.max_entries = max_entries
 
-    def _get_cache_key(self, prompt: str, model: str) -> str:
-        """Generate cache key from prompt and model."""
-        content = f"{model}:{prompt}"
-        return hashlib.md5(content.encode('utf-8')).hexdigest()
+        # One connection shared across the worker threads and the async
+        # fan-out; sqlite3 connections are not thread-safe, so statements
+        # are serialized behind a lock
+        self._lock = threading.Lock()
+        self._conn = sqlite3.connect(
+            str(self.cache_dir / "responses.db"),
+            check_same_thread=False
+        )
+        with self._conn:
+            self._conn.execute("PRAGMA journal_mode=WAL")
+            self._conn.execute("PRAGMA synchronous=NORMAL")
+            self._conn.execute(
+                "CREATE TABLE IF NOT EXISTS cache ("
+                "key BLOB PRIMARY KEY, response BLOB NOT NULL, ts REAL NOT NULL)"
+            )
+            # Both eviction DELETEs and the freshness cutoff in get() filter
+            # on ts; the index turns them into range scans instead of full
+            # table scans
+            self._conn.execute("CREATE INDEX IF NOT EXISTS idx_cache_ts ON cache(ts)")
+            # One sweep at startup clears anything left from earlier runs;
+            # after that eviction runs every _EVICT_EVERY writes instead of
+            # on each set, keeping maintenance off the write hot path
+            self._evict()
+        self._writes_since_evict = 0
+
+    def _get_cache_key(self, prompt: str, model: str) -> bytes:
+        """
+        Generate cache key from prompt and model.
 
-    def _get_cache_path(self, cache_key: str) -> Path:
-        """Get cache file path for a key."""
-        return self.cache_dir / f"{cache_key}.json"
+        Uses BLAKE2b fed incrementally, which is both faster than MD5 on the
+        multi-KB prompts this agent sends and avoids materializing a
+        model+prompt concatenation just to hash it. The raw digest is used
+        directly as the key — no hex expansion.
+        """
+        h = hashlib.blake2b(digest_size=16)
+        h.update(model.encode('utf-8'))
+        h.update(b":")
+        h.update(prompt.encode('utf-8'))
+        return h.digest()
 
-    def _clean_expired_entries(self):
+    _EVICT_EVERY = 32
+
+    def _evict(self):
         """
-        Remove expired cache entries and enforce max entries limit.
-        
-        This method cleans up the cache by removing entries that have exceeded
-        the maximum age and enforcing the maximum number of entries limit.
+        Remove expired cache entries and enforce the max entries limit.
+
+        Both rules run as single DELETE statements against the timestamp
+        column, so eviction cost no longer scales with a directory listing
+        plus a stat per entry.
         """
-        try:
-            cache_files = list(self.cache_dir.glob("*.json"))
-            if len(cache_files) > self.max_entries:
-                # Sort by modification time, keep newest
-                cache_files.sort(key=lambda f: f.stat().st_mtime, reverse=True)
-                for old_file in cache_files[self.max_entries:]:
-                    old_file.unlink()
-
-            # Remove expired entries
-            current_time = time.time()
-            max_age_seconds = self.max_age_hours * 3600
-
-            for cache_file in cache_files:
-                if current_time - cache_file.stat().st_mtime > max_age_seconds:
-                    cache_file.unlink()
-        except Exception as e:
-            logger.warning(f"Cache cleanup failed: {e}")
+        cutoff = time.time() - self.max_age_hours * 3600
+        self._conn.execute("DELETE FROM cache WHERE ts < ?", (cutoff,))
+        self._conn.execute(
+            "DELETE FROM cache WHERE key NOT IN "
+            "(SELECT key FROM cache ORDER BY ts DESC LIMIT ?)",
+            (self.max_entries,)
+        )
 
     def get(self, prompt: str, model: str) -> Optional[str]:
         """
         Get cached response for a prompt and model.
-        
+
         Args:
             prompt: The original prompt that was sent to the API
             model: The model that was used for the API call
-            
+
         Returns:
             Cached response if found and not expired, None otherwise
         """
-        if not self.cache_dir.exists():
-            return None
-
         cache_key = self._get_cache_key(prompt, model)
-        cache_path = self._get_cache_path(cache_key)
+        cutoff = time.time() - self.max_age_hours * 3600
 
         try:
-            if cache_path.exists():
-                with open(cache_path, 'r', encoding='utf-8') as f:
-                    data = json.load(f)
-                    return data.get('response')
+            with self._lock:
+                row = self._conn.execute(
+                    "SELECT response FROM cache WHERE key = ? AND ts > ?",
+                    (cache_key, cutoff)
+                ).fetchone()
+            if row is None:
+                return None
+            value = row[0]
+            # Entries written before compression landed are plain text
+            if isinstance(value, bytes):
+                return zlib.decompress(value).decode("utf-8")
+            return value
         except Exception as e:
             logger.warning(f"Cache read failed: {e}")
-
-        return None
+            return None
 
     def set(self, prompt: str, model: str, response: str):
         """
         Cache a response for a prompt and model.
-        
+
         Args:
             prompt: The original prompt that was sent to the API
             model: The model that was used for the API call
             response: The API response to cache
         """
-        try:
-            self._clean_expired_entries()
-
-            cache_key = self._get_cache_key(prompt, model)
-            cache_path = self._get_cache_path(cache_key)
-
-            data = {
-                'prompt': prompt[:200],  # Store truncated prompt for debugging
-                'model': model,
-                'response': response,
-                'timestamp': time.time()
-            }
-
-            with open(cache_path, 'w', encoding='utf-8') as f:
-                json.dump(data, f, ensure_ascii=False, indent=2)
+        cache_key = self._get_cache_key(prompt, model)
 
+        try:
+            with self._lock, self._conn:
+                self._conn.execute(
+                    "INSERT OR REPLACE INTO cache (key, response, ts) VALUES (?, ?, ?)",
+                    (cache_key, zlib.compress(response.encode("utf-8"), 6), time.time())
+                )
+                self._writes_since_evict += 1
+                if self._writes_since_evict >= self._EVICT_EVERY:
+                    self._evict()
+                    self._writes_since_evict = 0
         except Exception as e:
             logger.warning(f"Cache write failed: {e}")
 
     def clear(self):
         """Clear all cached entries."""
         try:
-            for cache_file in self.cache_dir.glob("*.json"):
-                cache_file.unlink()
+            with self._lock, self._conn:
+                self._conn.execute("DELETE FROM cache")
         except Exception as e:
             logger.warning(f"Cache clear failed: {e}")
 
 
 def call_ollama_api(
-    prompt: str, 
-    model: str, 
-    max_retries: int = 3, 
-    retry_delay: int = 2, 
+    prompt: str,
+    model: str,
+    max_retries: int = 3,
+    retry_delay: int = 2,
     api_timeout: int = 300,
     use_cache: bool = False,
-    cache: Optional[ResponseCache] = None
+    cache: Optional[ResponseCache] = None,
+    on_token: Optional[Callable[[str], Optional[bool]]] = None,
+    options: Optional[Dict] = None
 ) -> str:
     """
     Call Ollama API with retry logic and optional caching.
 
     This function handles all API communication with the Ollama service, including
-    retry logic with exponential backoff, JSON response parsing, and optional
-    response caching.
+    retry logic with exponential backoff, streamed response handling, and optional
+    response caching. Responses are streamed so tokens are consumed while the
+    model is still generating instead of blocking until the full completion is
+    buffered server-side.
 
     Args:
         prompt: The prompt to send to the API
@@ -175,6 +291,10 @@ def call_ollama_api(
         api_timeout: API timeout (seconds)
         use_cache: Whether to use caching
         cache: Cache instance if using caching
+        on_token: Optional callback invoked per streamed token; returning
+            False aborts the stream early and the partial text is returned
+        options: Optional Ollama generation options (e.g. stop sequences)
+            forwarded verbatim in the request body
 
     Returns:
         API response text
@@ -192,36 +312,60 @@ def call_ollama_api(
     for attempt in range(max_retries):
         try:
             logger.info(f"Sending request to Ollama (attempt {attempt + 1})")
-            
-            response = requests.post(
+
+            parts: List[str] = []
+            decode_error: Optional[ValueError] = None
+
+            payload = {
+                "model": model,
+                "prompt": prompt,
+                "stream": True,
+                "keep_alive": OLLAMA_KEEP_ALIVE,
+            }
+            if options:
+                payload["options"] = options
+
+            with _HTTP.stream(
+                "POST",
                 OLLAMA_API_URL,
-                json={
-                    "model": model,
-                    "prompt": prompt,
-                    "stream": False,
-                },
+                content=_json_dumps(payload),
                 headers=get_ollama_headers(),
                 timeout=api_timeout
-            )
-            response.raise_for_status()
-            
-            try:
-                resp_data = response.json()
-            except ValueError as e:  # JSON decode error
-                logger.error(f"Failed to decode JSON response: {e}")
-                logger.debug(f"Raw response: {response.text}")
+            ) as response:
+                response.raise_for_status()
+
+                for line in response.iter_lines():
+                    if not line:
+                        continue
+                    try:
+                        chunk = _json_loads(line)
+                    except ValueError as e:  # JSON decode error
+                        decode_error = e
+                        break
+
+                    token = chunk.get("response") or chunk.get("text", "")
+                    if token:
+                        parts.append(token)
+                        if on_token is not None and on_token(token) is False:
+                            logger.info("Token callback requested early stream termination")
+                            break
+                    if chunk.get("done"):
+                        break
+
+            if decode_error is not None:
+                logger.error(f"Failed to decode JSON response: {decode_error}")
                 if attempt < max_retries - 1:
-                    time.sleep(retry_delay * (2 ** attempt))
+                    time.sleep(_backoff_delay(retry_delay, attempt))
                     continue
                 else:
-                    raise DocGeneratorError(f"Invalid JSON response from API: {e}")
-            
-            content = resp_data.get("response") or resp_data.get("text", "")
-            
+                    raise DocGeneratorError(f"Invalid JSON response from API: {decode_error}")
+
+            content = "".join(parts)
+
             if not content:
-                logger.error(f"Empty response received: {resp_data}")
+                logger.error("Empty response received from stream")
                 if attempt < max_retries - 1:
-                    time.sleep(retry_delay * (2 ** attempt))
+                    time.sleep(_backoff_delay(retry_delay, attempt))
                     continue
                 else:
                     raise DocGeneratorError("Invalid API response format from Ollama - no content returned")
@@ -235,22 +379,279 @@ def call_ollama_api(
             logger.info("API call completed successfully")
             return content
             
-        except requests.Timeout:
+        except httpx.TimeoutException:
             logger.warning(f"Timeout on attempt {attempt + 1}")
             if attempt < max_retries - 1:
-                time.sleep(retry_delay * (2 ** attempt))
+                time.sleep(_backoff_delay(retry_delay, attempt))
             else:
                 raise DocGeneratorError(f"API timeout after {max_retries} attempts")
                 
-        except requests.RequestException as e:
+        except httpx.HTTPError as e:
             logger.error(f"Request failed on attempt {attempt + 1}: {e}")
             if attempt < max_retries - 1:
-                time.sleep(retry_delay * (2 ** attempt))
+                time.sleep(_backoff_delay(retry_delay, attempt))
             else:
                 raise DocGeneratorError(f"API request failed after {max_retries} attempts: {e}")
         except Exception as e:
             logger.error(f"Unexpected error on attempt {attempt + 1}: {e}")
             if attempt < max_retries - 1:
-                time.sleep(retry_delay * (2 ** attempt))
+                time.sleep(_backoff_delay(retry_delay, attempt))
             else:
-                raise DocGeneratorError(f"Unexpected error after {max_retries} attempts: {e}")
\ No newline at end of file
+                raise DocGeneratorError(f"Unexpected error after {max_retries} attempts: {e}")
+
+
+async def call_ollama_api_async(
+    prompt: str,
+    model: str,
+    session: aiohttp.ClientSession,
+    max_retries: int = 3,
+    retry_delay: int = 2,
+    use_cache: bool = False,
+    cache: Optional[ResponseCache] = None
+) -> str:
+    """
+    Async variant of call_ollama_api sharing a single aiohttp session.
+
+    The retry loop mirrors the synchronous implementation (exponential backoff,
+    caching) but uses non-blocking I/O so multiple prompts can be awaited
+    concurrently with asyncio.gather.
+
+    Args:
+        prompt: The prompt to send to the API
+        model: The model to use
+        session: Shared aiohttp session (owns timeout and connection pool)
+        max_retries: Maximum number of retry attempts
+        retry_delay: Delay between retries (seconds)
+        use_cache: Whether to use caching
+        cache: Cache instance if using caching
+
+    Returns:
+        API response text
+
+    Raises:
+        DocGeneratorError: If all retries fail or response is invalid
+    """
+    if use_cache and cache:
+        cached_response = cache.get(prompt, model)
+        if cached_response:
+            logger.info("Using cached response")
+            return cached_response
+
+    for attempt in range(max_retries):
+        try:
+            logger.info(f"Sending async request to Ollama (attempt {attempt + 1})")
+
+            async with session.post(
+                OLLAMA_API_URL,
+                data=_json_dumps({
+                    "model": model,
+                    "prompt": prompt,
+                    "stream": False,
+                    "keep_alive": OLLAMA_KEEP_ALIVE,
+                }),
+                headers=get_ollama_headers()
+            ) as response:
+                response.raise_for_status()
+                try:
+                    resp_data = _json_loads(await response.read())
+                except ValueError as e:
+                    logger.error(f"Failed to decode JSON response: {e}")
+                    if attempt < max_retries - 1:
+                        await asyncio.sleep(_backoff_delay(retry_delay, attempt))
+                        continue
+                    raise DocGeneratorError(f"Invalid JSON response from API: {e}")
+
+            content = resp_data.get("response") or resp_data.get("text", "")
+
+            if not content:
+                logger.error(f"Empty response received: {resp_data}")
+                if attempt < max_retries - 1:
+                    await asyncio.sleep(_backoff_delay(retry_delay, attempt))
+                    continue
+                raise DocGeneratorError("Invalid API response format from Ollama - no content returned")
+
+            content = content.strip()
+
+            if use_cache and cache:
+                cache.set(prompt, model, content)
+
+            logger.info("Async API call completed successfully")
+            return content
+
+        except asyncio.TimeoutError:
+            logger.warning(f"Timeout on attempt {attempt + 1}")
+            if attempt < max_retries - 1:
+                await asyncio.sleep(_backoff_delay(retry_delay, attempt))
+            else:
+                raise DocGeneratorError(f"API timeout after {max_retries} attempts")
+
+        except aiohttp.ClientError as e:
+            logger.error(f"Request failed on attempt {attempt + 1}: {e}")
+            if attempt < max_retries - 1:
+                await asyncio.sleep(_backoff_delay(retry_delay, attempt))
+            else:
+                raise DocGeneratorError(f"API request failed after {max_retries} attempts: {e}")
+
+
+async def _hedged_call(coro_factory):
+    """
+    Run a call, optionally hedging it with a duplicate against tail latency.
+
+    When OLLAMA_HEDGE_DELAY is positive and the first attempt has not
+    finished within that many seconds, a second identical request is fired
+    and whichever returns a result first wins; the loser is cancelled. This
+    bounds a straggling request at roughly hedge delay plus one normal
+    call instead of a full timeout. Disabled by default (delay 0) since a
+    hedge doubles server-side generation work for the hedged call.
+
+    Args:
+        coro_factory: Zero-argument callable producing a fresh call coroutine
+
+    Returns:
+        Result of the first attempt to complete successfully
+    """
+    first = asyncio.create_task(coro_factory())
+    if OLLAMA_HEDGE_DELAY <= 0:
+        return await first
+
+    done, pending = await asyncio.wait({first}, timeout=OLLAMA_HEDGE_DELAY)
+    if done:
+        return first.result()
+
+    logger.info(f"Hedging slow request after {OLLAMA_HEDGE_DELAY}s")
+    pending = {first, asyncio.create_task(coro_factory())}
+    last_error: Optional[BaseException] = None
+    while pending:
+        done, pending = await asyncio.wait(pending, return_when=asyncio.FIRST_COMPLETED)
+        for task in done:
+            if task.exception() is None:
+                for leftover in pending:
+                    leftover.cancel()
+                return task.result()
+            last_error = task.exception()
+    raise last_error
+
+
+class _AdaptiveWindow:
+    """
+    Latency-feedback concurrency window for the async fan-out.
+
+    Firing every prompt at once can overwhelm OLLAMA_NUM_PARALLEL and make
+    requests queue server-side. The window starts at OLLAMA_NUM_PARALLEL
+    in-flight requests and adjusts itself from observed completion latency:
+    an EMA comfortably under target grows the window by one permit, an EMA
+    past twice the target shrinks it by one.
+    """
+
+    _EMA_ALPHA = 0.3
+
+    def __init__(self, initial: int, target_latency: float, max_size: int = 16):
+        self._capacity = max(1, initial)
+        self._max_size = max_size
+        self._target_latency = target_latency
+        self._sem = asyncio.Semaphore(self._capacity)
+        self._latency_ema: Optional[float] = None
+
+    async def acquire(self) -> None:
+        await self._sem.acquire()
+
+    def release(self, latency: float) -> None:
+        if self._latency_ema is None:
+            self._latency_ema = latency
+        else:
+            self._latency_ema = (self._EMA_ALPHA * latency
+                                 + (1 - self._EMA_ALPHA) * self._latency_ema)
+
+        if self._latency_ema < self._target_latency and self._capacity < self._max_size:
+            # Backend has headroom: return this permit plus one extra
+            self._capacity += 1
+            self._sem.release()
+            self._sem.release()
+        elif self._latency_ema > 2 * self._target_latency and self._capacity > 1:
+            # Requests are queuing: swallow this permit to shrink the window
+            self._capacity -= 1
+        else:
+            self._sem.release()
+
+
+async def _gather_ollama_calls(
+    prompts: List[str],
+    model: str,
+    max_retries: int,
+    retry_delay: int,
+    api_timeout: int,
+    use_cache: bool,
+    cache: Optional[ResponseCache],
+    max_concurrency: Optional[int] = None
+) -> List[str]:
+    """Fan out multiple prompts over one aiohttp session with asyncio.gather."""
+    timeout = aiohttp.ClientTimeout(total=api_timeout)
+    window = _AdaptiveWindow(max_concurrency or OLLAMA_NUM_PARALLEL, OLLAMA_TARGET_LATENCY)
+    # Cap sockets to the same ceiling as the sync client's pool so a large
+    # batch multiplexes over a bounded, keep-alive connection set instead of
+    # opening one connection per prompt
+    connector = aiohttp.TCPConnector(limit=MAX_KEEPALIVE_CONNECTIONS)
+
+    async with aiohttp.ClientSession(timeout=timeout, connector=connector) as session:
+        async def _bounded_call(prompt: str) -> str:
+            await window.acquire()
+            start = time.monotonic()
+            try:
+                return await _hedged_call(lambda: call_ollama_api_async(
+                    prompt,
+                    model,
+                    session,
+                    max_retries=max_retries,
+                    retry_delay=retry_delay,
+                    use_cache=use_cache,
+                    cache=cache
+                ))
+            finally:
+                window.release(time.monotonic() - start)
+
+        return list(await asyncio.gather(*(
+            _bounded_call(prompt) for prompt in prompts
+        )))
+
+
+def call_ollama_api_many(
+    prompts: List[str],
+    model: str,
+    max_retries: int = 3,
+    retry_delay: int = 2,
+    api_timeout: int = 300,
+    use_cache: bool = False,
+    cache: Optional[ResponseCache] = None,
+    max_concurrency: Optional[int] = None
+) -> List[str]:
+    """
+    Call Ollama API for multiple prompts concurrently.
+
+    All network round-trips are overlapped, so total latency approaches the
+    slowest single call instead of the sum of all calls. Results are returned
+    in the same order as the input prompts.
+
+    Args:
+        prompts: Prompts to send to the API
+        model: The model to use
+        max_retries: Maximum number of retry attempts per prompt
+        retry_delay: Delay between retries (seconds)
+        api_timeout: API timeout (seconds)
+        use_cache: Whether to use caching
+        cache: Cache instance if using caching
+        max_concurrency: Initial concurrency window size (defaults to
+            OLLAMA_NUM_PARALLEL); the window still adapts from latency
+
+    Returns:
+        List of API response texts, one per prompt
+
+    Raises:
+        DocGeneratorError: If any prompt fails after all retries
+    """
+    if not prompts:
+        return []
+
+    return asyncio.run(_gather_ollama_calls(
+        prompts, model, max_retries, retry_delay, api_timeout, use_cache, cache,
+        max_concurrency=max_concurrency
+    ))
\ No newline at end of file
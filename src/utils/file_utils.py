@@ -2,6 +2,7 @@
 
 import os
 import logging
+from functools import lru_cache
 from pathlib import Path
 from typing import Dict, List, Optional, Set
 
@@ -43,6 +44,9 @@ PRIORITY_FILES: Dict[str, Set[str]] = {
 
 MAX_CONTENT_PREVIEW: int = 2000
 
+MAX_FILE_READ_BYTES: int = int(os.getenv("MAX_FILE_READ_BYTES", str(2 * 1024 * 1024)))
+"""Files larger than this are skipped to bound per-file memory use."""
+
 
 def _get_allowed_extensions(project_type: str) -> Set[str]:
     """
@@ -75,35 +79,75 @@ def _get_priority_files(project_type: str) -> Set[str]:
     return PRIORITY_FILES.get(project_type, PRIORITY_FILES["frontend"] | PRIORITY_FILES["backend"])
 
 
+def _iter_tree(start_path: str):
+    """
+    Yield the DirEntry of every file under start_path.
+
+    Iterative os.scandir walk with an explicit stack: DirEntry type checks
+    are answered from the directory read itself (no per-entry stat on
+    platforms that report d_type), and entry.path/entry.name are already
+    constructed strings, so the hot loop does no os.path.join or basename
+    work. Ignored directories are pruned before they are descended into;
+    unreadable directories are logged and skipped, matching os.walk's
+    default of not raising.
+
+    Args:
+        start_path: Root directory to walk
+
+    Yields:
+        os.DirEntry objects for regular files
+    """
+    stack = [start_path]
+    while stack:
+        root = stack.pop()
+        try:
+            with os.scandir(root) as entries:
+                for entry in entries:
+                    try:
+                        if entry.is_dir(follow_symlinks=False):
+                            if entry.name not in IGNORED_DIRECTORIES:
+                                stack.append(entry.path)
+                        elif entry.is_file(follow_symlinks=False):
+                            yield entry
+                    except OSError:
+                        continue
+        except OSError as e:
+            logger.warning(f"Could not scan {root}: {e}")
+
+
+_FRONTEND_INDICATORS: Set[str] = frozenset(["package.json", "yarn.lock", "pnpm-lock.yaml"])
+
+_BACKEND_INDICATORS: Set[str] = frozenset([
+    "pom.xml", "build.gradle", "go.mod", "Cargo.toml", "requirements.txt", "Gemfile"
+])
+
+
+@lru_cache(maxsize=32)
 def detect_project_type(start_path: str) -> str:
     """
     Auto-detect project type based on configuration files.
-    
+
+    Results are memoized per path: detection walks the directory tree, and
+    repeated calls for the same root (agent runs, draft generation, graph
+    nodes) should not re-pay that cost.
+
     Args:
         start_path: Root directory to analyze
-        
+
     Returns:
         Project type: 'frontend', 'backend', or 'mixed'
     """
-    indicators = {
-        "frontend": ["package.json", "yarn.lock", "pnpm-lock.yaml"],
-        "backend": ["pom.xml", "build.gradle", "go.mod", "Cargo.toml", "requirements.txt", "Gemfile"]
-    }
-    
     found_types = set()
-    
-    for root, dirs, files in os.walk(start_path):
-        dirs[:] = [d for d in dirs if d not in IGNORED_DIRECTORIES]
-        
-        for file in files:
-            if file in indicators["frontend"]:
-                found_types.add("frontend")
-            if file in indicators["backend"]:
-                found_types.add("backend")
-        
+
+    for entry in _iter_tree(start_path):
+        name = entry.name
+        if name in _FRONTEND_INDICATORS:
+            found_types.add("frontend")
+        if name in _BACKEND_INDICATORS:
+            found_types.add("backend")
         if len(found_types) == 2:
             return "mixed"
-    
+
     if "frontend" in found_types:
         return "frontend"
     elif "backend" in found_types:
@@ -115,63 +159,99 @@ def detect_project_type(start_path: str) -> str:
 def find_code_files(start_path: str, max_files: int = 50, project_type: Optional[str] = None) -> List[str]:
     """
     Find supported code files in a directory with intelligent prioritization.
-    
+
+    The underlying directory walk is memoized per (path, max_files,
+    project_type), matching detect_project_type: repeated agent runs over
+    the same root skip the filesystem scan. Call
+    _scan_code_files.cache_clear() if the tree changes mid-process.
+
     Args:
         start_path: Root directory to search
         max_files: Maximum number of files to return
         project_type: Project type ('frontend', 'backend', 'mixed', or None for auto-detect)
-        
+
     Returns:
         List of file paths, with priority files first
     """
     if not os.path.isdir(start_path):
         raise ValueError(f"Invalid directory: {start_path}")
-    
+
     if project_type is None:
         project_type = detect_project_type(start_path)
-    
+
+    return list(_scan_code_files(start_path, max_files, project_type))
+
+
+@lru_cache(maxsize=16)
+def _scan_code_files(start_path: str, max_files: int, project_type: str) -> tuple:
+    """
+    Walk the tree and collect prioritized code files (memoized).
+
+    Args:
+        start_path: Root directory to search
+        max_files: Maximum number of files to return
+        project_type: Resolved project type
+
+    Returns:
+        Tuple of file paths, with priority files first
+    """
     priority_files_list = _get_priority_files(project_type)
     allowed_extensions = _get_allowed_extensions(project_type)
     
     priority_files: List[str] = []
     code_files: List[str] = []
-    
-    for root, dirs, files in os.walk(start_path):
-        dirs[:] = [d for d in dirs if d not in IGNORED_DIRECTORIES]
-        
-        for file in files:
-            if not any(file.endswith(ext) for ext in allowed_extensions):
+
+    for entry in _iter_tree(start_path):
+        name = entry.name
+        # One splitext + frozenset probe instead of a linear endswith scan
+        # over ~30 suffixes per file
+        if os.path.splitext(name)[1] not in allowed_extensions:
+            continue
+
+        if name in priority_files_list:
+            priority_files.append(entry.path)
+            continue
+
+        # Drop oversized files (minified bundles, generated dumps) here
+        # rather than at read time: the DirEntry stat is cached from the
+        # walk, and skipping early keeps them from eating max_files slots.
+        # Priority files stay subject to read_file_safe's own guard only.
+        try:
+            if entry.stat(follow_symlinks=False).st_size > MAX_FILE_READ_BYTES:
+                logger.debug(f"Skipping oversized file during scan: {entry.path}")
                 continue
-                
-            file_path = os.path.join(root, file)
-            if os.path.basename(file) in priority_files_list:
-                priority_files.append(file_path)
-            else:
-                code_files.append(file_path)
-    
+        except OSError:
+            pass
+        code_files.append(entry.path)
+
     all_files = priority_files + code_files
-    return all_files[:max_files]
+    return tuple(all_files[:max_files])
 
 
 def read_file_safe(file_path: str) -> Optional[str]:
     """
     Safely read file content with error handling.
-    
+
+    Reads the file as one binary blob and decodes it in a single pass,
+    skipping the text-mode incremental decoder, and refuses files larger
+    than MAX_FILE_READ_BYTES so a stray artifact cannot blow up memory.
+
     Args:
         file_path: Path to file to read
-        
+
     Returns:
         File content or None if reading fails
     """
     try:
-        with open(file_path, "r", encoding="utf-8", errors="ignore") as f:
-            return f.read()
+        if os.stat(file_path).st_size > MAX_FILE_READ_BYTES:
+            logger.warning(f"Skipping {file_path}: larger than {MAX_FILE_READ_BYTES} bytes")
+            return None
+        with open(file_path, "rb") as f:
+            data = f.read()
+        return data.decode("utf-8", errors="ignore")
     except (IOError, OSError) as e:
         logger.warning(f"Could not read {file_path}: {e}")
         return None
-    except UnicodeDecodeError as e:
-        logger.warning(f"Could not decode {file_path}: {e}")
-        return None
     except Exception as e:
         logger.warning(f"Unexpected error reading {file_path}: {e}")
         return None
\ No newline at end of file
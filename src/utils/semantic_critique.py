@@ -124,25 +124,57 @@ class SemanticCritiqueAnalyzer:
             ]
         }
 
+        # Each aspect's pattern list is fused into one compiled alternation,
+        # so scoring makes a single scan over the critique per aspect instead
+        # of one findall (plus regex-cache lookup) per individual pattern
+        self._compiled_positive = {
+            aspect: re.compile("|".join(patterns), re.IGNORECASE)
+            for aspect, patterns in self.positive_patterns.items()
+        }
+        self._compiled_negative = {
+            aspect: re.compile("|".join(patterns), re.IGNORECASE)
+            for aspect, patterns in self.negative_patterns.items()
+        }
+
+        # Analysis is pure per critique text, and converging refinement runs
+        # re-analyze identical critiques, so results are memoized per instance
+        self._analysis_cache: Dict[str, SemanticScore] = {}
+
     def analyze_critique_semantically(self, critique: str) -> SemanticScore:
         """
         Analyze critique using semantic understanding rather than keyword matching.
-        
+
+        Results are memoized: the analysis depends only on the critique text,
+        and both critique enhancement and positivity checks score the same
+        text during an iteration.
+
         Args:
             critique: The critique text to analyze
-            
+
         Returns:
             SemanticScore with detailed breakdown
         """
-        critique_lower = critique.lower().strip()
-        
-        # Analyze different aspects semantically
+        cached = self._analysis_cache.get(critique)
+        if cached is not None:
+            return cached
+
+        score = self._analyze_critique(critique)
+
+        if len(self._analysis_cache) >= 256:
+            self._analysis_cache.clear()
+        self._analysis_cache[critique] = score
+        return score
+
+    def _analyze_critique(self, critique: str) -> SemanticScore:
+        """Score a critique across all aspects (uncached)."""
+        # The compiled alternations are case-insensitive, so the critique is
+        # scanned as-is — no lowercased copy of the whole text per call
         scores = {}
         confidences = {}
-        
+
         for aspect in ['technical_accuracy', 'completeness', 'clarity', 'structure', 'usefulness']:
-            pos_matches = self._count_pattern_matches(critique_lower, self.positive_patterns[aspect])
-            neg_matches = self._count_pattern_matches(critique_lower, self.negative_patterns[aspect])
+            pos_matches = len(self._compiled_positive[aspect].findall(critique))
+            neg_matches = len(self._compiled_negative[aspect].findall(critique))
             
             # Semantic scoring logic
             aspect_score = self._calculate_aspect_score(pos_matches, neg_matches)
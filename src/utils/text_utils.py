@@ -1,50 +1,118 @@
 """Text processing utilities for the AI Documentation Agent."""
 
+import ast
+import os
 import re
-from typing import Dict
+from typing import Dict, Optional, Tuple
+
+# Compiled once at import: these run per file (extraction) or per response
+# (cleanup), and re.compile in the call path would re-hash the pattern on
+# every invocation
+_DOCSTRING_RE = re.compile(r'(def|class)\s+([^\s\(]+).*?:\s*\n\s*"""(.*?)"""', re.DOTALL)
+_JSDOC_RE = re.compile(
+    r'/\*\*(.*?)\*/\s*(?:export\s+)?(?:function|class|const|let|var)\s+([^\s\(=]+)',
+    re.DOTALL
+)
+_CODE_FENCE_RE = re.compile(r"```.*?```", re.DOTALL)
 
 
 def extract_docstrings(content: str) -> Dict[str, str]:
-    """Extract Python docstrings from code."""
+    """
+    Extract Python docstrings from code.
+
+    Parses with ast and collects docstrings via ast.get_docstring — the
+    parser runs in C and, unlike the old regex, handles decorators,
+    multi-line signatures, single-quoted docstrings and nested
+    definitions. Files that do not parse (snippets, other Python
+    versions) fall back to the regex scan so they still yield whatever
+    can be matched.
+    """
+    try:
+        tree = ast.parse(content)
+    except (SyntaxError, ValueError):
+        return _extract_docstrings_regex(content)
+
+    docstrings = {}
+    for node in ast.walk(tree):
+        if isinstance(node, (ast.FunctionDef, ast.AsyncFunctionDef, ast.ClassDef)):
+            docstring = ast.get_docstring(node)
+            if docstring:
+                kind = "class" if isinstance(node, ast.ClassDef) else "def"
+                docstrings[f"{kind} {node.name}"] = docstring
+
+    return docstrings
+
+
+def _extract_docstrings_regex(content: str) -> Dict[str, str]:
+    """Regex fallback for content that ast cannot parse."""
     docstrings = {}
-    pattern = r'(def|class)\s+([^\s\(]+).*?:\s*\n\s*"""(.*?)"""'
-    
-    for match in re.finditer(pattern, content, re.DOTALL):
+
+    for match in _DOCSTRING_RE.finditer(content):
         entity_type, entity_name, docstring = match.groups()
         docstrings[f"{entity_type} {entity_name}"] = docstring.strip()
-    
+
     return docstrings
 
 
 def extract_jsdoc(content: str) -> Dict[str, str]:
     """Extract JSDoc comments from JavaScript/TypeScript code."""
     jsdocs = {}
-    pattern = r'/\*\*(.*?)\*/\s*(?:export\s+)?(?:function|class|const|let|var)\s+([^\s\(=]+)'
-    
-    for match in re.finditer(pattern, content, re.DOTALL):
+
+    for match in _JSDOC_RE.finditer(content):
         doc_comment, entity_name = match.groups()
         doc_lines = [line.strip().lstrip('*').strip() for line in doc_comment.split('\n')]
         cleaned_doc = '\n'.join(line for line in doc_lines if line)
         jsdocs[entity_name] = cleaned_doc
-    
+
     return jsdocs
 
 
+# Extension -> (extractor, block label) dispatch used by
+# extract_doc_comments; one splitext + dict probe picks the handler
+_EXTRACTORS = {
+    '.py': (extract_docstrings, 'Docstrings'),
+    '.js': (extract_jsdoc, 'JSDoc'),
+    '.ts': (extract_jsdoc, 'JSDoc'),
+    '.tsx': (extract_jsdoc, 'JSDoc'),
+    '.jsx': (extract_jsdoc, 'JSDoc'),
+}
+
+
+def extract_doc_comments(path: str, content: str) -> Optional[Tuple[str, Dict[str, str]]]:
+    """
+    Extract documentation comments for a file, dispatching on extension.
+
+    Args:
+        path: File path (only the extension is inspected)
+        content: Full file content
+
+    Returns:
+        (block label, entries) — e.g. ("Docstrings", {...}) — or None when
+        the extension has no extractor or nothing was found
+    """
+    handler = _EXTRACTORS.get(os.path.splitext(path)[1])
+    if handler is None:
+        return None
+    extract, label = handler
+    entries = extract(content)
+    return (label, entries) if entries else None
+
+
 def clean_markdown_response(response: str) -> str:
     """
     Clean markdown response by removing code block markers.
-    
+
     This function removes markdown code block delimiters and other formatting
     markers that may be included in LLM responses but are not desired in the
     final documentation.
-    
+
     Args:
         response: Raw response from the LLM
-        
+
     Returns:
         Cleaned response with formatting markers removed
     """
     # Remove markdown code block markers
-    cleaned = re.sub(r"```.*?```", "", response, flags=re.DOTALL)
+    cleaned = _CODE_FENCE_RE.sub("", response)
     # Remove any special formatting markers if present
-    return cleaned.strip()
\ No newline at end of file
+    return cleaned.strip()
@@ -55,6 +55,10 @@ class Calculator:
     })
     def test_agent_config_with_env_vars(self):
         """Test agent configuration with environment variables."""
+        # Env parsing is memoized; drop the caches so the patched values
+        # are read, and again afterwards so other tests see the defaults
+        AgentConfig.reload_env()
+        self.addCleanup(AgentConfig.reload_env)
         config = AgentConfig()
 
         self.assertEqual(config.max_retries, 5)
@@ -191,7 +195,9 @@ class Calculator:
             agent.file_contents,
             "markdown",
             "test-model",
-            "backend"
+            "backend",
+            use_cache=agent.config.enable_caching,
+            cache=agent.cache
         )
 
     def test_is_critique_positive_perfect(self):
@@ -343,6 +349,61 @@ class Calculator:
         self.assertIsNotNone(agent.cache)
         self.assertEqual(agent.cache.cache_dir, Path(".test_cache"))
 
+    def test_split_merge_round_trip_duplicate_subheadings(self):
+        """Test batched split/merge keeps duplicate subheadings per H2 section."""
+        doc = (
+            "# Project Documentation\n"
+            "\n"
+            "## 1. Install\n"
+            "Intro A\n"
+            "### Example\n"
+            "install example A\n"
+            "\n"
+            "## 2. Deploy\n"
+            "Intro B\n"
+            "### Example\n"
+            "deploy example B"
+        )
+
+        sections = AIAgent._split_sections(doc)
+        self.assertEqual(len(sections), 3)  # preamble + two H2 sections
+
+        # Simulate two refinement batches coming back and being merged
+        merged = AIAgent._merge_refined_sections([
+            "\n\n".join(sections[:2]),
+            "\n\n".join(sections[2:]),
+        ])
+
+        self.assertEqual(merged.count("### Example"), 2)
+        self.assertIn("install example A", merged)
+        self.assertIn("deploy example B", merged)
+        # Each example stays under its own H2 section
+        self.assertLess(merged.index("## 1. Install"), merged.index("install example A"))
+        self.assertLess(merged.index("install example A"), merged.index("## 2. Deploy"))
+        self.assertLess(merged.index("## 2. Deploy"), merged.index("deploy example B"))
+
+    def test_split_ignores_headings_inside_code_fences(self):
+        """Test that H2-looking lines inside code fences do not split sections."""
+        doc = (
+            "## 1. Setup\n"
+            "```bash\n"
+            "## not a heading\n"
+            "echo hi\n"
+            "```\n"
+            "\n"
+            "## 2. Usage\n"
+            "run it"
+        )
+
+        sections = AIAgent._split_sections(doc)
+        self.assertEqual(len(sections), 2)
+        self.assertIn("## not a heading", sections[0])
+
+        merged = AIAgent._merge_refined_sections(sections)
+        self.assertEqual(merged.count("## not a heading"), 1)
+        # The fenced line stays in its section, before the next H2
+        self.assertLess(merged.index("## not a heading"), merged.index("## 2. Usage"))
+
     def test_agent_with_caching_disabled(self):
         """Test agent initialization with caching disabled."""
         config = AgentConfig()
@@ -89,14 +89,22 @@ class TestResponseCache(unittest.TestCase):
 class TestCallOllamaApi(unittest.TestCase):
     """Test cases for call_ollama_api function."""
 
-    @patch('src.utils.api_utils.requests.post')
-    def test_call_ollama_api_success(self, mock_post):
-        """Test successful API call."""
-        # Mock the response
+    @staticmethod
+    def _mock_stream(mock_stream, lines):
+        """Configure the mocked streaming context manager with NDJSON lines."""
         mock_response = MagicMock()
         mock_response.raise_for_status.return_value = None
-        mock_response.json.return_value = {"response": "test response"}
-        mock_post.return_value = mock_response
+        mock_response.iter_lines.return_value = lines
+        mock_stream.return_value.__enter__.return_value = mock_response
+        return mock_response
+
+    @patch('src.utils.api_utils._HTTP.stream')
+    def test_call_ollama_api_success(self, mock_stream):
+        """Test successful API call."""
+        self._mock_stream(mock_stream, [
+            '{"response": "test ", "done": false}',
+            '{"response": "response", "done": true}',
+        ])
 
         result = call_ollama_api(
             prompt="test prompt",
@@ -105,16 +113,12 @@ class TestCallOllamaApi(unittest.TestCase):
         )
 
         self.assertEqual(result, "test response")
-        mock_post.assert_called_once()
+        mock_stream.assert_called_once()
 
-    @patch('src.utils.api_utils.requests.post')
-    def test_call_ollama_api_json_error(self, mock_post):
+    @patch('src.utils.api_utils._HTTP.stream')
+    def test_call_ollama_api_json_error(self, mock_stream):
         """Test API call with JSON decode error."""
-        # Mock the response to raise JSON decode error
-        mock_response = MagicMock()
-        mock_response.raise_for_status.return_value = None
-        mock_response.json.side_effect = ValueError("Invalid JSON")
-        mock_post.return_value = mock_response
+        self._mock_stream(mock_stream, ['not valid json'])
 
         with self.assertRaises(DocGeneratorError):
             call_ollama_api(
@@ -123,10 +127,10 @@ class TestCallOllamaApi(unittest.TestCase):
                 max_retries=1
             )
 
-    @patch('src.utils.api_utils.requests.post')
-    def test_call_ollama_api_timeout(self, mock_post):
+    @patch('src.utils.api_utils._HTTP.stream')
+    def test_call_ollama_api_timeout(self, mock_stream):
         """Test API call with timeout."""
-        mock_post.side_effect = TimeoutError()
+        mock_stream.side_effect = TimeoutError()
 
         with self.assertRaises(DocGeneratorError):
             call_ollama_api(
@@ -135,14 +139,10 @@ class TestCallOllamaApi(unittest.TestCase):
                 max_retries=1
             )
 
-    @patch('src.utils.api_utils.requests.post')
-    def test_call_ollama_api_empty_response(self, mock_post):
+    @patch('src.utils.api_utils._HTTP.stream')
+    def test_call_ollama_api_empty_response(self, mock_stream):
         """Test API call with empty response."""
-        # Mock the response with empty content
-        mock_response = MagicMock()
-        mock_response.raise_for_status.return_value = None
-        mock_response.json.return_value = {"response": ""}
-        mock_post.return_value = mock_response
+        self._mock_stream(mock_stream, ['{"response": "", "done": true}'])
 
         with self.assertRaises(DocGeneratorError):
             call_ollama_api(
@@ -151,6 +151,24 @@ class TestCallOllamaApi(unittest.TestCase):
                 max_retries=1
             )
 
+    @patch('src.utils.api_utils._HTTP.stream')
+    def test_call_ollama_api_on_token_early_stop(self, mock_stream):
+        """Test that the on_token callback can abort the stream early."""
+        self._mock_stream(mock_stream, [
+            '{"response": "first", "done": false}',
+            '{"response": " second", "done": false}',
+            '{"response": " third", "done": true}',
+        ])
+
+        result = call_ollama_api(
+            prompt="test prompt",
+            model="test-model",
+            max_retries=1,
+            on_token=lambda token: False
+        )
+
+        self.assertEqual(result, "first")
+
 
 if __name__ == '__main__':
     unittest.main()
\ No newline at end of file